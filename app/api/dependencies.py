@@ -43,16 +43,22 @@ def get_item_audio_manager() -> ItemAudioManager:
 
 @lru_cache
 def get_items_service() -> ItemsService:
+    # Deleting an item cascades to its attempts, which the summary cache counts
     return ItemsService(
         get_database_manager(),
         get_tts_engine_manager(),
         get_item_audio_manager(),
+        on_attempts_changed=get_stats_service().clear_summary_cache,
     )
 
 
 @lru_cache
 def get_attempts_service() -> AttemptsService:
-    return AttemptsService(get_database_manager())
+    # New attempts invalidate the cached summary stats
+    return AttemptsService(
+        get_database_manager(),
+        on_attempts_changed=get_stats_service().clear_summary_cache,
+    )
 
 
 @lru_cache
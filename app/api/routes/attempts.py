@@ -97,7 +97,7 @@ async def list_attempts(
         None, description="Filter attempts since this timestamp"
     ),
     until: Optional[datetime] = Query(
-        None, description="Filter attempts until this timestamp"
+        None, description="Filter attempts before this timestamp (exclusive)"
     ),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -44,6 +44,11 @@ def get_items_service() -> ItemsService:
     return _get_items_service()
 
 
+def get_audio_dir() -> str:
+    """Directory item audio files are served from; overridable in tests."""
+    return settings.audio_dir
+
+
 @router.post(
     "",
     response_model=ItemResponse,
@@ -417,6 +422,7 @@ async def update_item_difficulty(
 async def get_item_audio(
     item_id: int,
     items_service: ItemsService = Depends(get_items_service),
+    audio_dir: str = Depends(get_audio_dir),
 ):
     """Stream the audio file for a dictation item."""
     try:
@@ -430,7 +436,7 @@ async def get_item_audio(
 
         # Build audio file path
         audio_filename = f"item_{item_id}.wav"
-        audio_path = os.path.join(settings.audio_dir, audio_filename)
+        audio_path = os.path.join(audio_dir, audio_filename)
 
         if not os.path.exists(audio_path):
             raise HTTPException(
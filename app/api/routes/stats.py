@@ -13,6 +13,7 @@ from app.models.schemas import (
     PracticeLogResponse,
     PracticeLogEntry,
 )
+from app.services.exceptions import ServiceError
 from app.services.stats_service import StatsService
 
 router = APIRouter(
@@ -43,7 +44,9 @@ def get_stats_service() -> StatsService:
 )
 async def get_summary_stats(
     since: Optional[datetime] = Query(None, description="Start of time window"),
-    until: Optional[datetime] = Query(None, description="End of time window"),
+    until: Optional[datetime] = Query(
+        None, description="End of time window (exclusive)"
+    ),
     stats_service: StatsService = Depends(get_stats_service),
 ):
     """Get summary statistics."""
@@ -91,9 +94,15 @@ async def get_summary_stats(
 )
 async def get_practice_log(
     since: Optional[datetime] = Query(None, description="Start of time window"),
-    until: Optional[datetime] = Query(None, description="End of time window"),
+    until: Optional[datetime] = Query(
+        None, description="End of time window (exclusive)"
+    ),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from a previous page; takes precedence over page",
+    ),
     stats_service: StatsService = Depends(get_stats_service),
 ):
     """Get practice log with per-audio statistics."""
@@ -111,6 +120,7 @@ async def get_practice_log(
             until,
             page,
             per_page,
+            cursor,
         )
 
         # Convert to response format
@@ -124,10 +134,13 @@ async def get_practice_log(
             page=result["page"],
             per_page=result["per_page"],
             total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"],
         )
 
     except HTTPException:
         raise
+    except ServiceError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -67,6 +67,7 @@ class Settings(BaseSettings):
     # Metadata / observability settings
     metadata_schema_version: str = "2025-11-22"
     metadata_cache_ttl_seconds: int = 60
+    stats_summary_cache_ttl_seconds: float = 5.0  # 0 disables the cache
     metadata_commit_sha: Optional[str] = None
     metadata_build_branch: Optional[str] = None
     metadata_build_timestamp: Optional[str] = None
@@ -92,6 +93,8 @@ class Settings(BaseSettings):
 
         if self.metadata_cache_ttl_seconds <= 0:
             self.metadata_cache_ttl_seconds = 60
+        if self.stats_summary_cache_ttl_seconds < 0:
+            self.stats_summary_cache_ttl_seconds = 0
 
         normalized_keys = [key.strip() for key in self.api_keys if key.strip()]
         if self.api_keys_csv:
@@ -93,10 +93,12 @@ def rate_limit_dependency(
 ) -> Callable:
     """Return a FastAPI dependency enforcing a rate limit per identity."""
 
-    async def _dependency(identity: str = Depends(request_identity)) -> None:
+    async def _dependency(
+        identity: str = Depends(request_identity),
+        limiter: RateLimiter = Depends(get_rate_limiter),
+    ) -> None:
         rate_limit = limit or settings.api_rate_limit_per_minute
         window = window_seconds or settings.api_rate_limit_window_seconds
-        limiter = get_rate_limiter()
         try:
             limiter.hit(f"{bucket}:{identity}", rate_limit, window)
         except RateLimitExceeded as exc:
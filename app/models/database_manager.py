@@ -3,9 +3,10 @@
 import os
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, select, text
 from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
@@ -22,6 +23,13 @@ class DatabaseManager:
         # Configure database engine
         if database_url.startswith("sqlite"):
             self._ensure_sqlite_parent_dir(database_url)
+            # An in-memory database lives and dies with its connection, so every
+            # session must share the one connection or it sees an empty schema
+            pool_options = (
+                {"poolclass": StaticPool}
+                if self._is_sqlite_memory(database_url)
+                else {}
+            )
             # Add SQLite-specific options
             self.engine = create_engine(
                 database_url,
@@ -29,6 +37,7 @@ class DatabaseManager:
                 connect_args={
                     "check_same_thread": False,
                 },
+                **pool_options,
             )
 
             # Configure basic SQLite pragmas
@@ -60,11 +69,19 @@ class DatabaseManager:
         Base.metadata.create_all(bind=self.engine)
 
     @staticmethod
-    def _ensure_sqlite_parent_dir(database_url: str) -> None:
+    def _is_sqlite_memory(database_url: str) -> bool:
         url = make_url(database_url)
-        db_path = url.database
-        if not db_path or db_path == ":memory:":
+        return (
+            not url.database
+            or url.database in (":memory:", "file::memory:")
+            or url.query.get("mode") == "memory"
+        )
+
+    @classmethod
+    def _ensure_sqlite_parent_dir(cls, database_url: str) -> None:
+        if cls._is_sqlite_memory(database_url):
             return
+        db_path = make_url(database_url).database
         parent_dir = os.path.dirname(os.path.abspath(db_path))
         if parent_dir:
             os.makedirs(parent_dir, exist_ok=True)
@@ -77,8 +94,11 @@ class DatabaseManager:
         """Get a task by its ID."""
         from .models import Task
 
+        # task_id is unique, so a single-row scalar read is enough
         with self.get_session() as session:
-            return session.query(Task).filter(Task.task_id == task_id).first()
+            return session.execute(
+                select(Task).where(Task.task_id == task_id)
+            ).scalar_one_or_none()
 
     def get_all_tasks(
         self, status: Optional[str] = None, limit: int = 100
@@ -86,11 +106,13 @@ class DatabaseManager:
         """Get all tasks, optionally filtered by status."""
         from .models import Task
 
+        stmt = select(Task)
+        if status:
+            stmt = stmt.where(Task.status == status)
+        stmt = stmt.order_by(Task.created_at.desc()).limit(limit)
+
         with self.get_session() as session:
-            query = session.query(Task)
-            if status:
-                query = query.filter(Task.status == status)
-            return query.order_by(Task.created_at.desc()).limit(limit).all()
+            return list(session.scalars(stmt))
 
     def health_check(self) -> bool:
         """Check if database is accessible."""
@@ -77,6 +77,8 @@ class Item(Base):
     text = Column(Text, nullable=False)
     difficulty = Column(Integer, nullable=True, index=True)
     tags_json = Column(Text, nullable=True)  # JSON array of strings
+    # JSON array of scoring tokens derived from text, filled at creation
+    normalized_tokens_json = Column(Text, nullable=True)
     task_id = Column(
         String,
         ForeignKey("tasks.task_id", ondelete="SET NULL"),
@@ -115,6 +117,21 @@ class Item(Base):
         """Set tags as JSON string."""
         self.tags_json = json.dumps(value) if value else None
 
+    @property
+    def normalized_tokens(self) -> Optional[list[str]]:
+        """Parse cached scoring tokens; None when they were never computed."""
+        if self.normalized_tokens_json is None:
+            return None
+        try:
+            return json.loads(self.normalized_tokens_json)
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    @normalized_tokens.setter
+    def normalized_tokens(self, value: Optional[list[str]]):
+        """Set scoring tokens as JSON string."""
+        self.normalized_tokens_json = json.dumps(value) if value is not None else None
+
     @property
     def has_attempts(self) -> bool:
         """Check if item has any attempts."""
@@ -195,8 +212,9 @@ class Attempt(Base):
     __tablename__ = "attempts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    # Indexed via idx_attempts_item_created, whose leading column is item_id
     item_id = Column(
-        Integer, ForeignKey("items.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("items.id", ondelete="CASCADE"), nullable=False
     )
     text = Column(Text, nullable=False)
     percentage = Column(Integer, nullable=False)  # 0-100
@@ -301,10 +301,17 @@ class PracticeLogResponse(BaseModel):
     practice_log: List[PracticeLogEntry] = Field(
         ..., description="Practice log entries"
     )
-    total: int = Field(..., description="Total number of entries")
+    total: Optional[int] = Field(
+        None, description="Total number of entries; omitted for cursor pages"
+    )
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(
+        None, description="Total number of pages; omitted for cursor pages"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, if there is one"
+    )
 
 
 class HealthCheckResponse(BaseModel):
@@ -1,17 +1,31 @@
 """Attempts service for managing dictation attempts and scoring."""
 
+import multiprocessing
 import re
+import sys
 import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from threading import Lock
+from typing import Callable, Optional, Dict, Any, List, Sequence, Tuple
+
+from sqlalchemy import func, insert, select, update
 
 try:
-    from jiwer import wer
+    from jiwer import process_words
 
     HAS_JIWER = True
 except ImportError:
     HAS_JIWER = False
 
+try:
+    from rapidfuzz.distance import Levenshtein
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 try:
     from unidecode import unidecode
 
@@ -22,12 +36,258 @@ except ImportError:
 from app.models.database_manager import DatabaseManager
 from app.models.models import Attempt, Item
 
+# Columns returned for each attempt in list responses, in response key order
+_ATTEMPT_COLUMNS = (
+    Attempt.id,
+    Attempt.item_id,
+    Attempt.text,
+    Attempt.percentage,
+    Attempt.wer,
+    Attempt.words_ref,
+    Attempt.words_correct,
+    Attempt.created_at,
+)
+
+# Every ASCII character the punctuation regex below would blank out
+_ASCII_PUNCT_TO_SPACE = str.maketrans(
+    {
+        ch: " "
+        for ch in map(chr, range(128))
+        if not (ch.isalnum() or ch.isspace() or ch in "_'")
+    }
+)
+
+# ASCII input folds case and blanks punctuation in the same single pass
+_ASCII_LOWER_AND_PUNCT = str.maketrans(
+    {
+        **_ASCII_PUNCT_TO_SPACE,
+        **{ord(ch): ch.lower() for ch in map(chr, range(ord("A"), ord("Z") + 1))},
+    }
+)
+
+# Latin-1 letters (Finnish and most Western European text) mapped straight to
+# what NFD + unidecode would give, so common input never needs either call
+_LATIN1_TO_ASCII = (
+    str.maketrans(
+        {
+            ch: unidecode(unicodedata.normalize("NFD", ch))
+            for ch in map(chr, range(0xA0, 0x100))
+        }
+    )
+    if HAS_UNIDECODE
+    else {}
+)
+
+
+# Uncached: hypotheses are one-off strings, and reference tokens are already
+# kept per item by AttemptsService._ref_cache and Item.normalized_tokens
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison."""
+    if not text:
+        return ""
+
+    # Most input is plain ASCII (an O(1) flag check on str): one table pass
+    # replaces lower(), accent folding and both regexes
+    if text.isascii():
+        return " ".join(text.translate(_ASCII_LOWER_AND_PUNCT).split())
+
+    # Convert to lowercase and fold Latin-1 accents in one pass
+    text = text.lower().translate(_LATIN1_TO_ASCII)
+
+    if not text.isascii():
+        # Normalize Unicode (decompose accented characters)
+        text = unicodedata.normalize("NFD", text)
+
+        # Remove diacritics if unidecode is available
+        if HAS_UNIDECODE:
+            text = unidecode(text)
+
+    if text.isascii():
+        # One translate pass does the work of both regexes below
+        return " ".join(text.translate(_ASCII_PUNCT_TO_SPACE).split())
+
+    # Remove punctuation (but keep apostrophes) and extra whitespace
+    text = re.sub(r"[^\w\s\']", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    text = text.strip()
+
+    return text
+
+
+def _tokenize_words(text: str) -> Tuple[str, ...]:
+    """Tokenize text into words."""
+    if not text:
+        return ()
+
+    # Simple whitespace tokenization after normalization
+    return tuple(text.lower().split())
+
+
+def reference_tokens(text: str) -> Tuple[str, ...]:
+    """Normalize and tokenize ``text`` the way attempts are scored against it.
+
+    Reference words are reused across every attempt on an item, so they are
+    interned; hypotheses go through ``_hypothesis_tokens`` and are not, since
+    interned strings can outlive the request that produced them.
+    """
+    return tuple(map(sys.intern, _tokenize_words(_normalize_text(text))))
+
+
+def _hypothesis_tokens(text: str) -> Tuple[str, ...]:
+    """Normalize and tokenize a submitted attempt for scoring."""
+    return _tokenize_words(_normalize_text(text))
+
+
+def _score_words(ref_words: Sequence[str], hyp_words: Sequence[str]) -> Dict[str, Any]:
+    """Score tokenized words against reference tokens.
+
+    Pure and module-level, so the service and rescoring workers share it.
+    """
+    words_ref = len(ref_words)
+
+    if words_ref == 0:
+        # Handle edge case of empty reference
+        return {
+            "wer": 1.0 if len(hyp_words) > 0 else 0.0,
+            "percentage": 0 if len(hyp_words) > 0 else 100,
+            "words_ref": 0,
+            "words_correct": 0,
+        }
+
+    # Calculate WER using library if available
+    if HAS_JIWER:
+        try:
+            # One alignment yields both WER and the exact hit count
+            # (jiwer 4 dropped compute_measures in favour of process_words)
+            measures = process_words(" ".join(ref_words), " ".join(hyp_words))
+            wer_score = measures.wer
+            words_correct = measures.hits
+        except Exception:
+            # Fallback to manual calculation
+            wer_score, words_correct = _calculate_wer_manual(ref_words, hyp_words)
+    else:
+        # Manual WER calculation
+        wer_score, words_correct = _calculate_wer_manual(ref_words, hyp_words)
+
+    # Calculate percentage (0-100)
+    percentage = max(0, min(100, int((words_correct / words_ref) * 100)))
+
+    return {
+        "wer": min(1.0, max(0.0, wer_score)),  # Clamp to [0, 1]
+        "percentage": percentage,
+        "words_ref": words_ref,
+        "words_correct": words_correct,
+    }
+
+
+def _calculate_wer_manual(
+    ref_words: Sequence[str], hyp_words: Sequence[str]
+) -> tuple[float, int]:
+    """Manual WER calculation using edit distance."""
+    if not ref_words:
+        return (1.0 if hyp_words else 0.0), 0
+
+    # Word-level alignment, in C when rapidfuzz is installed. Words correct
+    # are the alignment's matches, as jiwer counts hits, so reordered words
+    # are not credited just for appearing somewhere in the hypothesis.
+    if HAS_RAPIDFUZZ:
+        edit_ops = Levenshtein.editops(ref_words, hyp_words)
+        edit_distance = len(edit_ops)
+        words_correct = len(ref_words) - sum(op.tag != "insert" for op in edit_ops)
+    else:
+        edit_distance, words_correct = _align_words(ref_words, hyp_words)
+
+    # Calculate WER, capped at 1 once every reference word needs an edit
+    wer_score = min(edit_distance, len(ref_words)) / len(ref_words)
+
+    return wer_score, words_correct
+
+
+def _align_words(ref_words: Sequence[str], hyp_words: Sequence[str]) -> Tuple[int, int]:
+    """Word-level Levenshtein alignment in pure Python.
+
+    Returns ``(distance, matches)``; among minimum-distance alignments the one
+    matching the most words wins.
+    """
+    # Shared leading and trailing words are matches that add no distance
+    start = 0
+    limit = min(len(ref_words), len(hyp_words))
+    while start < limit and ref_words[start] == hyp_words[start]:
+        start += 1
+    end = 0
+    while end < limit - start and ref_words[-1 - end] == hyp_words[-1 - end]:
+        end += 1
+    ref_words = ref_words[start : len(ref_words) - end]
+    hyp_words = hyp_words[start : len(hyp_words) - end]
+
+    # Alignment is symmetric, so run the short sequence along the row
+    if len(hyp_words) > len(ref_words):
+        ref_words, hyp_words = hyp_words, ref_words
+
+    # Each cell packs (edits, matches) as edits * scale - matches; matches
+    # never reach scale, so a plain min keeps the fewest edits, then the most
+    # matches
+    scale = len(ref_words) + 1
+
+    # Only the previous row is needed, so memory is O(min(m, n))
+    n = len(hyp_words)
+    prev = [j * scale for j in range(n + 1)]  # Insertions
+
+    for i, ref_word in enumerate(ref_words, start=1):
+        # Cost of pairing this reference word with every hypothesis word
+        costs = [-1 if ref_word == hyp_word else scale for hyp_word in hyp_words]
+        row = [i * scale]  # Deletions
+        left = i * scale
+        for j in range(1, n + 1):
+            # Inline three-way min; avoids a builtin call per cell
+            best = prev[j - 1] + costs[j - 1]  # Match / substitution
+            if prev[j] + scale < best:
+                best = prev[j] + scale  # Deletion
+            if left + scale < best:
+                best = left + scale  # Insertion
+            row.append(best)
+            left = best
+        prev = row
+
+    distance = -(-prev[n] // scale)
+    return distance, start + end + distance * scale - prev[n]
+
+
+# Items whose reference tokens AttemptsService keeps in memory
+REF_CACHE_SIZE = 256
+
+# Attempts scored per worker task when rescoring in a process pool
+RESCORE_CHUNK_SIZE = 1000
+
+# Spawn rescoring workers fresh: forking a process that runs server and TTS
+# threads can copy locks held by those threads into the child
+_RESCORE_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _score_batch(
+    reference_words: Sequence[str], hypothesis_texts: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """Score hypotheses against one reference; module-level so it pickles."""
+    return [
+        _score_words(reference_words, _hypothesis_tokens(text))
+        for text in hypothesis_texts
+    ]
+
 
 class AttemptsService:
     """Service for managing dictation attempts and scoring."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        on_attempts_changed: Optional[Callable[[], None]] = None,
+    ):
         self.db_manager = db_manager
+        # Called after attempts are inserted or rescored, e.g. to drop caches
+        self._on_attempts_changed = on_attempts_changed
+        # item_id -> (item text, reference tokens), least recently used first
+        self._ref_cache: OrderedDict[int, Tuple[str, Tuple[str, ...]]] = OrderedDict()
+        self._ref_cache_lock = Lock()
 
     def create_attempt(
         self,
@@ -35,30 +295,139 @@ class AttemptsService:
         user_text: str,
     ) -> Optional[Attempt]:
         """Create a new attempt with automatic scoring."""
+        attempts = self.create_attempts_bulk(item_id, [user_text])
+        return attempts[0] if attempts else None
+
+    def create_attempts_bulk(
+        self,
+        item_id: int,
+        user_texts: List[str],
+    ) -> Optional[List[Attempt]]:
+        """Score several attempts against one item and insert them together.
+
+        Returns None when the item does not exist.
+        """
         with self.db_manager.get_session() as session:
             # Get the item
             item = session.query(Item).filter(Item.id == item_id).first()
             if not item:
                 return None
 
-            # Calculate score
-            score_result = self._calculate_score(item.text, user_text)
+            # Calculate scores against the item's cached reference tokens
+            ref_words = self._get_ref_tokens(item)
+            rows = [
+                {
+                    "item_id": item_id,
+                    "text": user_text,
+                    **self._calculate_score(
+                        item.text, user_text, reference_words=ref_words
+                    ),
+                }
+                for user_text in user_texts
+            ]
+            if not rows:
+                return []
+
+            # One multi-row INSERT ... RETURNING instead of a flush per attempt
+            attempts = session.scalars(
+                insert(Attempt).returning(Attempt, sort_by_parameter_order=True),
+                rows,
+            ).all()
+            # Detach before commit so the returned rows stay loaded
+            for attempt in attempts:
+                session.expunge(attempt)
+            session.commit()
+
+        self._notify_attempts_changed()
+        return attempts
+
+    def rescore_all(
+        self, item_id: int, max_workers: Optional[int] = None
+    ) -> Optional[int]:
+        """Recompute the scores of every attempt on an item.
 
-            # Create attempt
-            attempt = Attempt(
-                item_id=item_id,
-                text=user_text,
-                percentage=score_result["percentage"],
-                wer=score_result["wer"],
-                words_ref=score_result["words_ref"],
-                words_correct=score_result["words_correct"],
-            )
+        More than one chunk of attempts is fanned out across a process pool,
+        since the DP is CPU-bound; smaller sets are scored in-process. No
+        session is held while scoring. Returns the number of attempts
+        rescored, or None when the item does not exist.
+        """
+        with self.db_manager.get_session() as session:
+            item_text = session.scalar(select(Item.text).where(Item.id == item_id))
+            if item_text is None:
+                return None
+            rows = session.execute(
+                select(Attempt.id, Attempt.text).where(Attempt.item_id == item_id)
+            ).all()
+
+        # Re-derive the tokens too, in case normalization rules changed
+        ref_words = reference_tokens(item_text)
+        ids = [row.id for row in rows]
+        texts = [row.text for row in rows]
+        chunks = [
+            texts[start : start + RESCORE_CHUNK_SIZE]
+            for start in range(0, len(texts), RESCORE_CHUNK_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_RESCORE_MP_CONTEXT
+            ) as executor:
+                batches = executor.map(_score_batch, [ref_words] * len(chunks), chunks)
+                scores = [score for batch in batches for score in batch]
+        else:
+            scores = _score_batch(ref_words, texts)
 
-            session.add(attempt)
+        with self.db_manager.get_session() as session:
+            item = session.get(Item, item_id)
+            if item is not None:
+                item.normalized_tokens = list(ref_words)
+            if ids:
+                # ORM bulk UPDATE by primary key: one executemany for all rows
+                session.execute(
+                    update(Attempt),
+                    [
+                        {"id": attempt_id, **score}
+                        for attempt_id, score in zip(ids, scores)
+                    ],
+                )
             session.commit()
-            session.refresh(attempt)
 
-            return attempt
+        self._store_ref_tokens(item_id, item_text, ref_words)
+        self._notify_attempts_changed()
+        return len(ids)
+
+    def _notify_attempts_changed(self) -> None:
+        if self._on_attempts_changed is not None:
+            self._on_attempts_changed()
+
+    def _get_ref_tokens(self, item: Item) -> Sequence[str]:
+        """Reference tokens for ``item``, from the in-process cache when valid.
+
+        Entries remember the text they were derived from, so an edited item (or
+        a reused id) misses instead of serving stale tokens.
+        """
+        with self._ref_cache_lock:
+            cached = self._ref_cache.get(item.id)
+            if cached is not None and cached[0] == item.text:
+                self._ref_cache.move_to_end(item.id)
+                return cached[1]
+
+        ref_words = item.normalized_tokens
+        ref_words = (
+            tuple(map(sys.intern, ref_words))
+            if ref_words is not None
+            else reference_tokens(item.text)
+        )
+        self._store_ref_tokens(item.id, item.text, ref_words)
+        return ref_words
+
+    def _store_ref_tokens(
+        self, item_id: int, text: str, ref_words: Tuple[str, ...]
+    ) -> None:
+        with self._ref_cache_lock:
+            self._ref_cache[item_id] = (text, ref_words)
+            self._ref_cache.move_to_end(item_id)
+            if len(self._ref_cache) > REF_CACHE_SIZE:
+                self._ref_cache.popitem(last=False)
 
     def get_attempt(self, attempt_id: int) -> Optional[Attempt]:
         """Get an attempt by ID."""
@@ -73,170 +442,82 @@ class AttemptsService:
         page: int = 1,
         per_page: int = 20,
     ) -> Dict[str, Any]:
-        """List attempts with filtering and pagination."""
-        with self.db_manager.get_session() as session:
-            # Start with base query
-            query = session.query(Attempt)
-
-            # Apply filters
-            if item_id:
-                query = query.filter(Attempt.item_id == item_id)
-
-            if since:
-                query = query.filter(Attempt.created_at >= since)
-
-            if until:
-                query = query.filter(Attempt.created_at <= until)
-
-            # Order by creation time (newest first)
-            query = query.order_by(Attempt.created_at.desc())
+        """List attempts with filtering and pagination.
+
+        Each attempt is a plain dict of column values; ``created_at`` is a
+        ``datetime``.
+        """
+        # Shared filters for the page and its total
+        conditions = []
+        if item_id:
+            conditions.append(Attempt.item_id == item_id)
+
+        if since:
+            conditions.append(Attempt.created_at >= since)
+
+        # Half-open [since, until), the same window the stats endpoints use
+        if until:
+            conditions.append(Attempt.created_at < until)
+
+        # Select plain columns plus the filtered total as a window, so one
+        # round-trip returns both the page and its count
+        offset = (page - 1) * per_page
+        page_stmt = (
+            select(*_ATTEMPT_COLUMNS, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(Attempt.created_at.desc())  # Newest first
+            .offset(offset)
+            .limit(per_page)
+        )
 
-            # Get total count before pagination
-            total = query.count()
-
-            # Apply pagination
-            offset = (page - 1) * per_page
-            attempts = query.offset(offset).limit(per_page).all()
-
-            # Build response
-            return {
-                "attempts": [self._attempt_to_dict(attempt) for attempt in attempts],
-                "total": total,
-                "page": page,
-                "per_page": per_page,
-                "total_pages": (total + per_page - 1) // per_page,
-            }
+        with self.db_manager.get_session() as session:
+            # created_at stays a datetime: the response model is datetime-typed,
+            # so formatting it here would only be parsed straight back
+            attempts = [dict(row) for row in session.execute(page_stmt).mappings()]
+            total = attempts[0]["total"] if attempts else 0
+            for attempt in attempts:
+                del attempt["total"]
+
+            # Past the last page there is no row to carry the total
+            if not attempts and offset:
+                total = session.execute(
+                    select(func.count(Attempt.id)).where(*conditions)
+                ).scalar_one()
+
+        # Build response
+        return {
+            "attempts": attempts,
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "total_pages": (total + per_page - 1) // per_page,
+        }
 
     def _calculate_score(
-        self, reference_text: str, hypothesis_text: str
+        self,
+        reference_text: str,
+        hypothesis_text: str,
+        reference_words: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
-        """Calculate WER and percentage score between reference and hypothesis."""
-        # Normalize both texts
-        ref_normalized = self._normalize_text(reference_text)
-        hyp_normalized = self._normalize_text(hypothesis_text)
-
-        # Tokenize into words
-        ref_words = self._tokenize_words(ref_normalized)
-        hyp_words = self._tokenize_words(hyp_normalized)
-
-        words_ref = len(ref_words)
-
-        if words_ref == 0:
-            # Handle edge case of empty reference
-            return {
-                "wer": 1.0 if len(hyp_words) > 0 else 0.0,
-                "percentage": 0 if len(hyp_words) > 0 else 100,
-                "words_ref": 0,
-                "words_correct": 0,
-            }
-
-        # Calculate WER using library if available
-        if HAS_JIWER:
-            try:
-                wer_score = wer(ref_words, hyp_words)
-                # Calculate words correct from WER
-                # WER = (S + D + I) / N, where S=substitutions, D=deletions, I=insertions, N=reference length
-                # Approximation: words_correct ≈ N * (1 - WER)
-                words_correct = max(0, int(words_ref * (1 - wer_score)))
-            except Exception:
-                # Fallback to manual calculation
-                wer_score, words_correct = self._calculate_wer_manual(
-                    ref_words, hyp_words
-                )
-        else:
-            # Manual WER calculation
-            wer_score, words_correct = self._calculate_wer_manual(ref_words, hyp_words)
+        """Calculate WER and percentage score between reference and hypothesis.
 
-        # Calculate percentage (0-100)
-        percentage = max(0, min(100, int((words_correct / words_ref) * 100)))
-
-        return {
-            "wer": min(1.0, max(0.0, wer_score)),  # Clamp to [0, 1]
-            "percentage": percentage,
-            "words_ref": words_ref,
-            "words_correct": words_correct,
-        }
+        ``reference_words`` skips re-tokenizing the reference when the caller
+        already has its tokens.
+        """
+        if reference_words is None:
+            reference_words = reference_tokens(reference_text)
+        return _score_words(reference_words, _hypothesis_tokens(hypothesis_text))
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
-        if not text:
-            return ""
-
-        # Convert to lowercase
-        text = text.lower()
-
-        # Normalize Unicode (decompose accented characters)
-        text = unicodedata.normalize("NFD", text)
+        return _normalize_text(text)
 
-        # Remove diacritics if unidecode is available
-        if HAS_UNIDECODE:
-            text = unidecode(text)
-
-        # Remove punctuation (but keep apostrophes) and extra whitespace
-        text = re.sub(r"[^\w\s\']", " ", text)
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
-
-        return text
-
-    def _tokenize_words(self, text: str) -> List[str]:
+    def _tokenize_words(self, text: str) -> Tuple[str, ...]:
         """Tokenize text into words."""
-        if not text:
-            return []
-
-        # Simple whitespace tokenization after normalization
-        words = text.split()
-        return [
-            word.lower() for word in words if word
-        ]  # Remove empty strings and convert to lowercase
+        return _tokenize_words(text)
 
     def _calculate_wer_manual(
-        self, ref_words: List[str], hyp_words: List[str]
+        self, ref_words: Sequence[str], hyp_words: Sequence[str]
     ) -> tuple[float, int]:
         """Manual WER calculation using edit distance."""
-        if not ref_words:
-            return (1.0 if hyp_words else 0.0), 0
-
-        # Calculate edit distance matrix
-        m, n = len(ref_words), len(hyp_words)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i  # Deletions
-        for j in range(n + 1):
-            dp[0][j] = j  # Insertions
-
-        # Fill the matrix
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if ref_words[i - 1] == hyp_words[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]  # Match
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i - 1][j],  # Deletion
-                        dp[i][j - 1],  # Insertion
-                        dp[i - 1][j - 1],  # Substitution
-                    )
-
-        # Calculate WER and words correct
-        edit_distance = dp[m][n]
-        wer_score = edit_distance / len(ref_words)
-        words_correct = max(0, len(ref_words) - edit_distance)
-
-        return wer_score, words_correct
-
-    def _attempt_to_dict(self, attempt: Attempt) -> Dict[str, Any]:
-        """Convert Attempt model to dictionary."""
-        return {
-            "id": attempt.id,
-            "item_id": attempt.item_id,
-            "text": attempt.text,
-            "percentage": attempt.percentage,
-            "wer": attempt.wer,
-            "words_ref": attempt.words_ref,
-            "words_correct": attempt.words_correct,
-            "created_at": (
-                attempt.created_at.isoformat() if attempt.created_at else None
-            ),
-        }
+        return _calculate_wer_manual(ref_words, hyp_words)
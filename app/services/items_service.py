@@ -2,7 +2,7 @@
 
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 
 from sqlalchemy import and_, func, true
 
@@ -11,6 +11,7 @@ from app.core.logging import get_logger
 from app.models.database_manager import DatabaseManager
 from app.models.models import Item, ItemTTS
 from app.models.enums import ItemTTSStatus
+from app.services.attempts_service import reference_tokens
 from app.services.exceptions import NotFoundError, ServiceError, ValidationError
 from app.services.item_audio_manager import ItemAudioManager
 
@@ -26,10 +27,13 @@ class ItemsService:
         db_manager: DatabaseManager,
         task_manager=None,
         audio_manager: Optional[ItemAudioManager] = None,
+        on_attempts_changed: Optional[Callable[[], None]] = None,
     ):
         self.db_manager = db_manager
         self.task_manager = task_manager
         self.audio_manager = audio_manager or ItemAudioManager(db_manager, task_manager)
+        # Called after deletes cascade to attempts, e.g. to drop stats caches
+        self._on_attempts_changed = on_attempts_changed
 
     def _calculate_difficulty_from_text(self, text: str) -> int:
         """Calculate difficulty level based on text length rules."""
@@ -68,35 +72,22 @@ class ItemsService:
 
         with self.db_manager.get_session() as session:
             # Create item with pending TTS status
-            item = Item(
-                locale=locale,
-                text=text,
-                difficulty=difficulty,
-                tags_json=None,
-            )
-
-            if tags:
-                item.tags = tags
+            item = self._build_item(locale, text, difficulty, tags)
 
+            # One flush inserts both rows (the item INSERT returns its id), so
+            # no commit + refresh round-trip is needed before the TTS row
             session.add(item)
-            session.commit()
-            session.refresh(item)
-
-            # Create ItemTTS record
-            tts_record = ItemTTS(
-                item_id=item.id,
-                status=ItemTTSStatus.PENDING,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
-            session.add(tts_record)
+            session.flush()
+
+            # Build the response before commit expires the instance
+            payload = self._item_to_dict(item)
             session.commit()
 
             if self.audio_manager:
-                self.audio_manager.schedule_generation(item.id, text, locale)
+                self.audio_manager.schedule_generation(payload["id"], text, locale)
 
             # Return clean data structure to avoid session binding issues
-            return self._item_to_dict(item)
+            return payload
 
     def bulk_create_items(self, items_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create multiple dictation items and enqueue TTS jobs in background."""
@@ -107,40 +98,30 @@ class ItemsService:
             for item_data in items_data:
                 try:
                     self._validate_locale(item_data["locale"])
-                    item = Item(
-                        locale=item_data["locale"],
-                        text=item_data["text"],
-                        difficulty=item_data.get("difficulty"),
-                        tags_json=None,
-                    )
-
-                    if item.difficulty is None:
-                        item.difficulty = self._calculate_difficulty_from_text(
+                    difficulty = item_data.get("difficulty")
+                    if difficulty is None:
+                        difficulty = self._calculate_difficulty_from_text(
                             item_data["text"]
                         )
 
-                    if item_data.get("tags"):
-                        item.tags = item_data["tags"]
-
+                    item = self._build_item(
+                        item_data["locale"],
+                        item_data["text"],
+                        difficulty,
+                        item_data.get("tags"),
+                    )
                     session.add(item)
                     session.flush()
-                    session.refresh(item)
-
-                    session.add(
-                        ItemTTS(
-                            item_id=item.id,
-                            status=ItemTTSStatus.PENDING,
-                            created_at=item.created_at,
-                            updated_at=item.updated_at,
-                        )
-                    )
+
+                    # Build the response before commit expires the instance
+                    payload = self._item_to_dict(item)
                     session.commit()
 
-                    created_items.append(self._item_to_dict(item))
+                    created_items.append(payload)
 
                     if self.audio_manager:
                         self.audio_manager.schedule_generation(
-                            item.id, item.text, item.locale
+                            payload["id"], payload["text"], payload["locale"]
                         )
 
                 except ValidationError as exc:
@@ -153,6 +134,38 @@ class ItemsService:
 
         return {"created_items": created_items, "failed_items": failed_items}
 
+    def _build_item(
+        self,
+        locale: str,
+        text: str,
+        difficulty: Optional[int],
+        tags: Optional[List[str]],
+    ) -> Item:
+        """Build a new item with its pending ItemTTS row attached.
+
+        Relationships are set while the item is still transient, so flushing
+        it never lazy-loads ``tts_record`` or ``attempts`` back from the DB.
+        """
+        now = datetime.now()
+        item = Item(
+            locale=locale,
+            text=text,
+            difficulty=difficulty,
+            tags_json=None,
+            created_at=now,
+            updated_at=now,
+            attempts=[],
+            tts_record=ItemTTS(
+                status=ItemTTSStatus.PENDING, created_at=now, updated_at=now
+            ),
+        )
+        item.normalized_tokens = list(reference_tokens(text))
+
+        if tags:
+            item.tags = tags
+
+        return item
+
     def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get an item by ID."""
         with self.db_manager.get_session() as session:
@@ -185,7 +198,10 @@ class ItemsService:
             # Delete the item (cascades to attempts and updates task)
             session.delete(item)
             session.commit()
-            return True
+
+        if self._on_attempts_changed is not None:
+            self._on_attempts_changed()
+        return True
 
     def list_items(
         self,
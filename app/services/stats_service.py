@@ -1,37 +1,132 @@
 """Stats service for aggregating practice statistics."""
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-
-from sqlalchemy import func, distinct
-
+import base64
+import binascii
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta
+from time import monotonic
+from typing import Optional, Dict, Any, List, Tuple
+
+from sqlalchemy import and_, distinct, func, or_, select
+
+from app.core.config import settings
 from app.models.database_manager import DatabaseManager
 from app.models.models import Attempt, Item
+from app.services.exceptions import ValidationError
+
+# Distinct (since, until) windows kept by the summary cache
+SUMMARY_CACHE_MAXSIZE = 128
+
+
+def _attempt_window(since: Optional[datetime], until: Optional[datetime]) -> list:
+    """Half-open ``[since, until)`` filters on the indexed ``created_at`` column."""
+    window = []
+    if since:
+        window.append(Attempt.created_at >= since)
+    if until:
+        window.append(Attempt.created_at < until)
+    return window
+
+
+def _encode_practice_log_cursor(last_practiced_at: datetime, item_id: int) -> str:
+    """Serialize the sort key of a practice-log entry into an opaque cursor."""
+    payload = {"last_practiced_at": last_practiced_at.isoformat(), "item_id": item_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_practice_log_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a cursor from ``_encode_practice_log_cursor``."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (
+            datetime.fromisoformat(payload["last_practiced_at"]),
+            int(payload["item_id"]),
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise ValidationError("Invalid practice log cursor", status_code=400) from exc
 
 
 class StatsService:
     """Service for aggregating dictation statistics."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        cache_ttl: Optional[float] = None,
+    ):
         self.db_manager = db_manager
+        self.cache_ttl = (
+            settings.stats_summary_cache_ttl_seconds if cache_ttl is None else cache_ttl
+        )
+        self._cache_enabled = self.cache_ttl > 0
+        self._cache_lock = threading.Lock()
+        # (since, until) -> (expires_at, summary), least recently used first
+        self._summary_cache: OrderedDict[
+            Tuple[Optional[datetime], Optional[datetime]],
+            Tuple[float, Dict[str, Any]],
+        ] = OrderedDict()
+
+    def set_cache_enabled(self, enabled: bool) -> None:
+        """Turn summary caching on or off; disabling also drops cached entries."""
+        self._cache_enabled = enabled and self.cache_ttl > 0
+        if not self._cache_enabled:
+            self.clear_summary_cache()
+
+    def clear_summary_cache(self) -> None:
+        """Forget every cached summary, e.g. after new attempts are recorded."""
+        with self._cache_lock:
+            self._summary_cache.clear()
 
     def get_summary_stats(
         self,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
     ) -> Dict[str, Any]:
-        """Get summary statistics for the specified time window."""
-        with self.db_manager.get_session() as session:
-            # Base query for attempts in time window
-            query = session.query(Attempt)
+        """Get summary statistics for the specified time window.
+
+        Results are cached per window for ``cache_ttl`` seconds so dashboards
+        polling the same range do not rerun the aggregate query.
+        """
+        if not self._cache_enabled:
+            return self._query_summary_stats(since, until)
+
+        key = (since, until)
+        with self._cache_lock:
+            cached = self._summary_cache.get(key)
+            if cached is not None and cached[0] > monotonic():
+                self._summary_cache.move_to_end(key)
+                return dict(cached[1])
+
+        summary = self._query_summary_stats(since, until)
+        with self._cache_lock:
+            self._summary_cache[key] = (
+                monotonic() + self.cache_ttl,
+                summary,
+            )
+            self._summary_cache.move_to_end(key)
+            while len(self._summary_cache) > SUMMARY_CACHE_MAXSIZE:
+                self._summary_cache.popitem(last=False)
+        return dict(summary)
 
-            if since:
-                query = query.filter(Attempt.created_at >= since)
-            if until:
-                query = query.filter(Attempt.created_at <= until)
+    def _query_summary_stats(
+        self,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Dict[str, Any]:
+        with self.db_manager.get_session() as session:
+            # One pass over the window computes every aggregate at once
+            stmt = select(
+                func.count().label("attempts_count"),
+                func.count(distinct(Attempt.item_id)).label("unique_items"),
+                func.avg(Attempt.percentage).label("avg_percentage"),
+                func.max(Attempt.percentage).label("max_percentage"),
+                func.min(Attempt.percentage).label("min_percentage"),
+            )
 
-            # Get total attempts
-            attempts_count = query.count()
+            stats = session.execute(stmt.where(*_attempt_window(since, until))).one()
+            attempts_count = stats.attempts_count
 
             if attempts_count == 0:
                 return {
@@ -43,25 +138,12 @@ class StatsService:
                     "total_practice_time_minutes": 0,
                 }
 
-            # Get unique audio items practiced
-            unique_items_practiced = query.with_entities(
-                distinct(Attempt.item_id)
-            ).count()
-
-            # Get comprehensive stats including min/max
-            stats = query.with_entities(
-                func.avg(Attempt.percentage).label("avg_percentage"),
-                func.max(Attempt.percentage).label("max_percentage"),
-                func.min(Attempt.percentage).label("min_percentage"),
-                func.avg(Attempt.wer).label("avg_wer"),
-            ).first()
-
             # Calculate total practice time (rough estimate: 30 seconds per attempt)
             total_practice_time_minutes = round(attempts_count * 0.5, 1)
 
             return {
                 "total_attempts": attempts_count,
-                "unique_items_practiced": unique_items_practiced,
+                "unique_items_practiced": stats.unique_items,
                 "average_score": round(float(stats.avg_percentage or 0), 2),
                 "best_score": stats.max_percentage or 0,
                 "worst_score": stats.min_percentage or 0,
@@ -74,52 +156,91 @@ class StatsService:
         until: Optional[datetime] = None,
         page: int = 1,
         per_page: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get per-audio practice log with aggregated statistics."""
-        with self.db_manager.get_session() as session:
-            # Subquery for attempts in time window
-            attempts_subq = session.query(Attempt)
+        """Get per-audio practice log with aggregated statistics.
 
-            if since:
-                attempts_subq = attempts_subq.filter(Attempt.created_at >= since)
-            if until:
-                attempts_subq = attempts_subq.filter(Attempt.created_at <= until)
+        Pages are addressed either by ``page`` or by an opaque ``cursor`` taken
+        from a previous response's ``next_cursor``. Cursor pages seek past the
+        last entry instead of counting and skipping rows, so ``total`` and
+        ``total_pages`` are None for them.
+        """
+        after = _decode_practice_log_cursor(cursor) if cursor else None
+
+        with self.db_manager.get_session() as session:
+            window = _attempt_window(since, until)
+
+            # Aggregate attempts per item straight off the (item_id, created_at)
+            # index; item columns are joined only for the page being returned
+            last_practiced_at = func.max(Attempt.created_at)
+            page_stmt = (
+                select(
+                    Attempt.item_id,
+                    func.count().label("attempt_count"),
+                    func.min(Attempt.created_at).label("first_attempt_at"),
+                    last_practiced_at.label("last_practiced_at"),
+                    func.avg(Attempt.percentage).label("average_score"),
+                    func.max(Attempt.percentage).label("best_score"),
+                    func.min(Attempt.percentage).label("worst_score"),
+                    func.avg(Attempt.wer).label("avg_wer"),
+                )
+                .where(*window)
+                .group_by(Attempt.item_id)
+                # Most recently practiced first; item id keeps ties stable
+                .order_by(last_practiced_at.desc(), Attempt.item_id.desc())
+            )
 
-            attempts_subq = attempts_subq.subquery()
+            if after is not None:
+                after_practiced_at, after_item_id = after
+                page_stmt = page_stmt.having(
+                    or_(
+                        last_practiced_at < after_practiced_at,
+                        and_(
+                            last_practiced_at == after_practiced_at,
+                            Attempt.item_id < after_item_id,
+                        ),
+                    )
+                )
+                # One extra row says whether another page follows
+                page_stmt = page_stmt.limit(per_page + 1)
+                total = None
+            else:
+                # Get total count before pagination
+                total = session.scalar(
+                    select(func.count(distinct(Attempt.item_id))).where(*window)
+                )
+                page_stmt = page_stmt.offset((page - 1) * per_page).limit(per_page)
 
-            # Main query: aggregate stats per item
-            query = (
-                session.query(
-                    Item.id.label("item_id"),
+            page_subq = page_stmt.subquery()
+            rows = session.execute(
+                select(
+                    page_subq,
                     Item.text,
                     Item.locale,
                     Item.difficulty,
                     Item.tags_json,
-                    func.count(attempts_subq.c.id).label("attempt_count"),
-                    func.min(attempts_subq.c.created_at).label("first_attempt_at"),
-                    func.max(attempts_subq.c.created_at).label("last_practiced_at"),
-                    func.avg(attempts_subq.c.percentage).label("average_score"),
-                    func.max(attempts_subq.c.percentage).label("best_score"),
-                    func.min(attempts_subq.c.percentage).label("worst_score"),
-                    func.avg(attempts_subq.c.wer).label("avg_wer"),
-                )
-                .outerjoin(attempts_subq, Item.id == attempts_subq.c.item_id)
-                .filter(attempts_subq.c.id.isnot(None))  # Only items with attempts
-                .group_by(
-                    Item.id, Item.text, Item.locale, Item.difficulty, Item.tags_json
                 )
+                .join(Item, Item.id == page_subq.c.item_id)
                 .order_by(
-                    func.max(attempts_subq.c.created_at).desc()
-                )  # Most recently practiced first
+                    page_subq.c.last_practiced_at.desc(), page_subq.c.item_id.desc()
+                )
+            ).all()
+
+            if total is None:
+                has_more = len(rows) > per_page
+                results = rows[:per_page]
+            else:
+                results = rows
+                has_more = (page - 1) * per_page + len(results) < total
+
+            next_cursor = (
+                _encode_practice_log_cursor(
+                    results[-1].last_practiced_at, results[-1].item_id
+                )
+                if has_more and results
+                else None
             )
 
-            # Get total count before pagination
-            total = query.count()
-
-            # Apply pagination
-            offset = (page - 1) * per_page
-            results = query.offset(offset).limit(per_page).all()
-
             # Format results
             practice_log = []
             for result in results:
@@ -127,8 +248,6 @@ class StatsService:
                 tags = []
                 if result.tags_json:
                     try:
-                        import json
-
                         tags = json.loads(result.tags_json)
                     except (json.JSONDecodeError, TypeError):
                         tags = []
@@ -163,25 +282,42 @@ class StatsService:
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "total_pages": (total + per_page - 1) // per_page,
+                "total_pages": (
+                    (total + per_page - 1) // per_page if total is not None else None
+                ),
+                "next_cursor": next_cursor,
             }
 
     def get_item_stats(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed statistics for a specific item."""
         with self.db_manager.get_session() as session:
-            # Get the item
-            item = session.query(Item).filter(Item.id == item_id).first()
-            if not item:
+            # Item lookup and attempt aggregates in one round trip; the outer
+            # join keeps the item row when it has no attempts yet
+            stats = session.execute(
+                select(
+                    Item.text,
+                    func.count(Attempt.id).label("attempts_count"),
+                    func.min(Attempt.created_at).label("first_attempt_at"),
+                    func.max(Attempt.created_at).label("last_attempt_at"),
+                    func.avg(Attempt.percentage).label("avg_percentage"),
+                    func.max(Attempt.percentage).label("best_percentage"),
+                    func.min(Attempt.percentage).label("worst_percentage"),
+                    func.avg(Attempt.wer).label("avg_wer"),
+                    func.min(Attempt.wer).label("best_wer"),
+                    func.max(Attempt.wer).label("worst_wer"),
+                )
+                .outerjoin(Attempt, Attempt.item_id == Item.id)
+                .where(Item.id == item_id)
+                .group_by(Item.id)
+            ).one_or_none()
+            if stats is None:
                 return None
 
-            # Get attempt statistics
-            attempts_query = session.query(Attempt).filter(Attempt.item_id == item_id)
-            attempts_count = attempts_query.count()
-
+            attempts_count = stats.attempts_count
             if attempts_count == 0:
                 return {
                     "item_id": item_id,
-                    "text": item.text,
+                    "text": stats.text,
                     "attempts_count": 0,
                     "first_attempt_at": None,
                     "last_attempt_at": None,
@@ -193,21 +329,9 @@ class StatsService:
                     "worst_wer": 0.0,
                 }
 
-            # Get aggregated stats
-            stats = attempts_query.with_entities(
-                func.min(Attempt.created_at).label("first_attempt_at"),
-                func.max(Attempt.created_at).label("last_attempt_at"),
-                func.avg(Attempt.percentage).label("avg_percentage"),
-                func.max(Attempt.percentage).label("best_percentage"),
-                func.min(Attempt.percentage).label("worst_percentage"),
-                func.avg(Attempt.wer).label("avg_wer"),
-                func.min(Attempt.wer).label("best_wer"),
-                func.max(Attempt.wer).label("worst_wer"),
-            ).first()
-
             return {
                 "item_id": item_id,
-                "text": item.text,
+                "text": stats.text,
                 "attempts_count": attempts_count,
                 "first_attempt_at": (
                     stats.first_attempt_at.isoformat()
@@ -235,6 +359,9 @@ class StatsService:
             # Calculate date range
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days - 1)
+            # Compare the raw column against midnight so the created_at index
+            # serves the range; date() is applied only when grouping
+            window_start = datetime.combine(start_date, time.min)
 
             # Base query
             query = session.query(
@@ -242,7 +369,7 @@ class StatsService:
                 func.count(Attempt.id).label("attempts"),
                 func.avg(Attempt.percentage).label("avg_percentage"),
                 func.avg(Attempt.wer).label("avg_wer"),
-            ).filter(func.date(Attempt.created_at) >= start_date)
+            ).filter(Attempt.created_at >= window_start)
 
             if item_id:
                 query = query.filter(Attempt.item_id == item_id)
@@ -29,10 +29,12 @@ class TagsService:
                 tag = Tag(name=tag_data.name)
 
                 session.add(tag)
+                # The INSERT's RETURNING fills id and the server-side timestamps
+                session.flush()
+                response = TagResponse(**tag.to_dict())
                 session.commit()
-                session.refresh(tag)
 
-                return TagResponse(**tag.to_dict())
+                return response
 
         except ValidationException:
             raise
@@ -0,0 +1,5 @@
+-- Migration: cache each item's normalized scoring tokens on the items row
+-- Target: SQLite (data/dictation.db)
+-- Existing rows stay NULL; attempts on them tokenize item.text on the fly.
+
+ALTER TABLE items ADD COLUMN normalized_tokens_json TEXT;
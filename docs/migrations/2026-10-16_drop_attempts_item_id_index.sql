@@ -0,0 +1,7 @@
+-- Migration: drop the single-column attempts.item_id index
+-- Target: SQLite (data/dictation.db)
+-- idx_attempts_item_created (item_id, created_at) covers item_id lookups and also
+-- returns an item's attempts already ordered by time, so the planner should use it.
+
+DROP INDEX IF EXISTS ix_attempts_item_id;
+CREATE INDEX IF NOT EXISTS idx_attempts_item_created ON attempts(item_id, created_at);
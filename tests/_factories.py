@@ -0,0 +1,62 @@
+"""Deterministic model factories and table helpers shared across test modules."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.database_manager import Base
+from app.models.models import Item
+
+
+def make_item(
+    session: Session,
+    *,
+    locale: str = "en-US",
+    text: str = "sample",
+    difficulty: int = 1,
+    tags: Optional[List[str]] = None,
+) -> Item:
+    """Add an item to ``session`` and flush so its id is assigned.
+
+    Committing is left to the caller, so several rows can share one transaction.
+    """
+
+    item = Item(locale=locale, text=text, difficulty=difficulty)
+    if tags is not None:
+        item.tags = tags
+    session.add(item)
+    session.flush()
+    return item
+
+
+def clear_tables(engine: Engine) -> None:
+    """Delete every row, children first, leaving the schema in place.
+
+    Far cheaper on SQLite than dropping and recreating the tables. Ids restart
+    at 1 because no table uses AUTOINCREMENT.
+    """
+
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+def relax_sqlite_durability(engine: Engine) -> None:
+    """Skip fsyncs and keep the rollback journal in memory on ``engine``.
+
+    Only for throwaway test databases: a crash mid-commit may corrupt the file.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.close()
+
+    # Connections opened before the listener existed keep their settings
+    engine.dispose()
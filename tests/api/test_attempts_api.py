@@ -0,0 +1,95 @@
+"""Integration tests for attempts API routes."""
+
+import pytest
+
+from tests._factories import make_item
+
+
+def test_create_attempt_endpoint_returns_created_attempt(test_client, db_manager):
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="Hello world").id
+        session.commit()
+
+    response = test_client.post(
+        "/v1/attempts",
+        json={"item_id": item_id, "text": "hello world"},
+    )
+
+    assert response.status_code == 201
+    payload = response.json()
+    assert payload["item_id"] == item_id
+    assert payload["percentage"] >= 0
+    assert payload["wer"] >= 0
+
+
+@pytest.mark.parametrize(
+    "method,url,body,expected_body",
+    [
+        (
+            "POST",
+            "/v1/attempts",
+            {"item_id": 999999, "text": "hello"},
+            b'{"detail":"Item not found"}',
+        ),
+        ("GET", "/v1/attempts/999999", None, b'{"detail":"Attempt not found"}'),
+    ],
+    ids=["create-missing-item", "get-missing-attempt"],
+)
+def test_missing_resource_returns_404(test_client, method, url, body, expected_body):
+    response = test_client.request(method, url, json=body)
+
+    assert response.status_code == 404
+    # Error bodies are fixed, so compare raw bytes rather than decoding JSON
+    assert response.content == expected_body
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"text": "hello"},
+        {"item_id": "abc", "text": "hello"},
+        {"item_id": 1},
+        {"item_id": 1, "text": "a" * 10001},
+    ],
+    ids=["empty", "missing-item", "non-int-item", "missing-text", "long-text"],
+)
+def test_create_attempt_rejects_invalid_payload(test_client, payload):
+    response = test_client.post("/v1/attempts", json=payload)
+
+    assert response.status_code == 422
+
+
+def test_list_attempts_endpoint_filters_by_item(
+    test_client, db_manager, attempts_service
+):
+    with db_manager.get_session() as session:
+        item_a_id = make_item(session, text="alpha").id
+        item_b_id = make_item(session, text="beta").id
+        session.commit()
+    attempts_service.create_attempt(item_a_id, "alpha")
+    attempts_service.create_attempt(item_b_id, "beta")
+
+    response = test_client.get("/v1/attempts", params={"item_id": item_a_id})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 1
+    assert len(payload["attempts"]) == 1
+    assert payload["attempts"][0]["item_id"] == item_a_id
+
+
+def test_get_attempt_endpoint_returns_attempt(
+    test_client, db_manager, attempts_service
+):
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="gamma delta").id
+        session.commit()
+    attempt = attempts_service.create_attempt(item_id, "gamma delta")
+
+    response = test_client.get(f"/v1/attempts/{attempt.id}")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["id"] == attempt.id
+    assert payload["item_id"] == item_id
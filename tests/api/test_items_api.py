@@ -0,0 +1,154 @@
+"""Integration tests for items API endpoints."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.models.enums import ItemTTSStatus
+from app.models.models import ItemTTS
+
+SUPPORTED_TTS_LOCALE = settings.tts_supported_languages[0]
+
+JSON_HEADERS = {"content-type": "application/json"}
+# One past the bulk endpoint's 100-item cap, serialized once at import
+TOO_MANY_ITEMS_BODY = json.dumps(
+    {"items": [{"locale": "fi", "text": f"Text {i}"} for i in range(101)]}
+).encode()
+
+# Audio is addressed by integer item id only; filenames and traversal never route
+BAD_AUDIO_PATHS = [
+    ("abc", 422),
+    ("1.5", 422),
+    ("item_1.wav", 422),
+    ("..%2F..%2Fetc%2Fpasswd", 404),
+    ("../../etc/passwd", 404),
+]
+
+
+@pytest.mark.asyncio
+async def test_get_item_tts_status_returns_payload(async_client, items_service):
+    item = items_service.create_item(
+        locale=SUPPORTED_TTS_LOCALE, text="Sample dictation text"
+    )
+
+    response = await async_client.get(f"/v1/items/{item['id']}/tts-status")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["item_id"] == item["id"]
+    assert payload["tts_status"] == ItemTTSStatus.PENDING.value
+    assert payload["text"].startswith("Sample")
+
+
+def test_get_item_tts_status_returns_404_for_missing_item(test_client):
+    response = test_client.get("/v1/items/999999/tts-status")
+
+    assert response.status_code == 404
+    assert response.content == b'{"detail":"Item not found"}'
+
+
+@pytest.mark.file_db
+@pytest.mark.asyncio
+async def test_concurrent_item_creation_assigns_unique_ids(async_client):
+    responses = await asyncio.gather(
+        *[
+            async_client.post(
+                "/v1/items", json={"locale": SUPPORTED_TTS_LOCALE, "text": f"Text {i}"}
+            )
+            for i in range(3)
+        ]
+    )
+
+    assert [response.status_code for response in responses] == [202] * 3
+    assert len({response.json()["id"] for response in responses}) == 3
+
+
+@pytest.mark.parametrize(
+    "endpoint,payload",
+    [
+        ("/v1/items", {}),
+        ("/v1/items", {"locale": "fi"}),
+        ("/v1/items", {"locale": "fi", "text": ""}),
+        ("/v1/items", {"locale": "f", "text": "hello"}),
+        ("/v1/items", {"locale": "fi", "text": "a" * 10001}),
+        ("/v1/items", {"locale": "fi", "text": "hello", "difficulty": 6}),
+        ("/v1/items", {"locale": "fi", "text": "hello", "tags": [""]}),
+        ("/v1/items", {"locale": "fi", "text": "hello", "tags": ["t"] * 21}),
+        ("/v1/items/bulk", {}),
+        ("/v1/items/bulk", {"items": []}),
+        ("/v1/items/bulk", {"items": [{"locale": "fi", "text": "ok"}, {"text": ""}]}),
+    ],
+    ids=[
+        "empty",
+        "missing-text",
+        "empty-text",
+        "short-locale",
+        "long-text",
+        "difficulty-range",
+        "blank-tag",
+        "too-many-tags",
+        "bulk-missing-items",
+        "bulk-empty-items",
+        "bulk-invalid-entry",
+    ],
+)
+def test_create_item_rejects_invalid_payload(test_client, endpoint, payload):
+    response = test_client.post(endpoint, json=payload)
+
+    assert response.status_code == 422
+
+
+def test_bulk_create_rejects_more_than_100_items(test_client, task_manager):
+    response = test_client.post(
+        "/v1/items/bulk", content=TOO_MANY_ITEMS_BODY, headers=JSON_HEADERS
+    )
+
+    assert response.status_code == 422
+    assert task_manager.submissions == []
+
+
+def _mark_audio_ready(db_manager, item_id: int) -> None:
+    with db_manager.get_session() as session:
+        record = session.query(ItemTTS).filter(ItemTTS.item_id == item_id).one()
+        record.status = ItemTTSStatus.READY
+        session.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_item_audio_streams_existing_file(
+    async_client, items_service, db_manager, audio_file
+):
+    item = items_service.create_item(locale=SUPPORTED_TTS_LOCALE, text="Audio text")
+    _mark_audio_ready(db_manager, item["id"])
+    audio_file(item["id"], b"RIFF-test")
+
+    response = await async_client.get(f"/v1/items/{item['id']}/audio")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+    assert response.content == b"RIFF-test"
+
+
+def test_get_item_audio_returns_404_when_file_missing(
+    test_client, items_service, db_manager
+):
+    item = items_service.create_item(locale=SUPPORTED_TTS_LOCALE, text="Audio text")
+    _mark_audio_ready(db_manager, item["id"])
+
+    response = test_client.get(f"/v1/items/{item['id']}/audio")
+
+    assert response.status_code == 404
+    assert response.content == b'{"detail":"Audio file not found"}'
+
+
+@pytest.mark.parametrize(
+    "item_ref,expected_status",
+    BAD_AUDIO_PATHS,
+    ids=[ref for ref, _ in BAD_AUDIO_PATHS],
+)
+def test_get_item_audio_rejects_non_id_paths(test_client, item_ref, expected_status):
+    response = test_client.get(f"/v1/items/{item_ref}/audio")
+
+    assert response.status_code == expected_status
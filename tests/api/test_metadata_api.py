@@ -7,9 +7,7 @@ def test_metadata_endpoint_returns_expected_sections(test_client):
     assert response.status_code == 200
     payload = response.json()
     assert payload["service"]["name"]
-    assert "build" in payload
-    assert "runtime" in payload
-    assert "providers" in payload
+    assert {"build", "runtime", "providers"} <= payload.keys()
 
 
 def test_metadata_endpoint_allows_field_filtering(test_client):
@@ -0,0 +1,76 @@
+"""API tests for the /v1/stats endpoints backed by a real database."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from app.models.models import Attempt
+from app.models.schemas import PracticeLogResponse, StatsSummaryResponse
+from tests._factories import make_item
+
+
+class ProgressResponse(BaseModel):
+    """The progress route returns a bare dict; mirror its shape here."""
+
+    progress: List[Dict[str, Any]]
+
+
+@pytest.mark.parametrize(
+    "url,schema",
+    [
+        ("/v1/stats/summary", StatsSummaryResponse),
+        ("/v1/stats/practice-log", PracticeLogResponse),
+        ("/v1/stats/progress", ProgressResponse),
+    ],
+    ids=["summary", "practice-log", "progress"],
+)
+@pytest.mark.asyncio
+async def test_stats_response_structure(async_client, url, schema):
+    response = await async_client.get(url)
+
+    assert response.status_code == 200
+    schema.model_validate(response.json())
+
+
+def test_practice_log_cursor_pages_through_every_item(test_client, session):
+    practiced_at = datetime(2025, 1, 1, 12, 0, 0)
+    item_ids = [make_item(session, text=f"Item {i}").id for i in range(5)]
+    session.add_all(
+        Attempt(
+            item_id=item_id,
+            text="attempt",
+            percentage=50,
+            wer=0.5,
+            words_ref=2,
+            words_correct=1,
+            created_at=practiced_at - timedelta(minutes=i),
+        )
+        for i, item_id in enumerate(item_ids)
+    )
+    session.commit()
+
+    seen = []
+    params = {"per_page": 2}
+    while True:
+        response = test_client.get("/v1/stats/practice-log", params=params)
+        assert response.status_code == 200
+        payload = response.json()
+        seen.extend(entry["item_id"] for entry in payload["practice_log"])
+        if not payload["next_cursor"]:
+            break
+        params = {"per_page": 2, "cursor": payload["next_cursor"]}
+
+    # Most recently practiced first, each item exactly once
+    assert seen == item_ids
+    assert payload["total"] is None
+
+
+def test_practice_log_rejects_malformed_cursor(test_client):
+    response = test_client.get(
+        "/v1/stats/practice-log", params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid practice log cursor"}
@@ -0,0 +1,65 @@
+"""Request-validation tests for /v1/stats that never touch the database."""
+
+from typing import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.api.routes import stats as stats_routes
+from app.core.config import settings
+from app.main import app
+
+WINDOW = "since=2025-01-02T00:00:00&until=2025-01-01T00:00:00"
+
+
+class StubStatsService:
+    """Answers only what the validation paths reach; no database behind it."""
+
+    def get_item_stats(self, item_id: int):
+        return None
+
+
+@pytest_asyncio.fixture()
+async def stats_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Dispatch straight into the ASGI app; no TestClient thread/loop bridge."""
+
+    monkeypatch.setattr(settings, "api_keys", ["test-suite-key"])
+    app.dependency_overrides[stats_routes.get_stats_service] = StubStatsService
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+        headers={settings.api_key_header_name: settings.api_keys[0]},
+    ) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "url,expected_status,detail_fragment",
+    [
+        (f"/v1/stats/summary?{WINDOW}", 400, "'since' must be before 'until'"),
+        (f"/v1/stats/practice-log?{WINDOW}", 400, "'since' must be before 'until'"),
+        ("/v1/stats/practice-log?page=0", 422, None),
+        ("/v1/stats/practice-log?per_page=101", 422, None),
+        ("/v1/stats/progress?days=0", 422, None),
+        ("/v1/stats/items/999999", 404, "Item not found"),
+    ],
+    ids=[
+        "summary-window",
+        "practice-log-window",
+        "practice-log-page",
+        "practice-log-per-page",
+        "progress-days",
+        "item-not-found",
+    ],
+)
+@pytest.mark.asyncio
+async def test_invalid_request(stats_client, url, expected_status, detail_fragment):
+    response = await stats_client.get(url)
+
+    assert response.status_code == expected_status
+    if detail_fragment:
+        assert detail_fragment in response.json()["detail"]
@@ -1,18 +1,27 @@
-def create_item(test_client, locale="fi", text="hello world"):
-    resp = test_client.post(
-        "/v1/items",
-        json={"locale": locale, "text": text, "difficulty": 1},
-    )
+import json
+
+JSON_HEADERS = {"content-type": "application/json"}
+# Request bodies serialized once at import and reused by every test
+ITEM_BODY = json.dumps(
+    {"locale": "fi", "text": "hello world", "difficulty": 1}
+).encode()
+SAME_LANG_BODY = json.dumps({"target_lang": "fi"}).encode()
+EN_BODY = json.dumps({"target_lang": "en"}).encode()
+
+
+def create_item(test_client):
+    resp = test_client.post("/v1/items", content=ITEM_BODY, headers=JSON_HEADERS)
     assert resp.status_code == 202
     return resp.json()["id"]
 
 
 def test_translation_rejects_same_source_and_target(test_client):
-    item_id = create_item(test_client, locale="fi")
+    item_id = create_item(test_client)
 
     resp = test_client.post(
         f"/v1/items/{item_id}/translations",
-        json={"target_lang": "fi"},
+        content=SAME_LANG_BODY,
+        headers=JSON_HEADERS,
     )
 
     assert resp.status_code == 400
@@ -21,11 +30,12 @@ def test_translation_rejects_same_source_and_target(test_client):
 
 
 def test_translation_success_with_stub_provider(test_client, translation_manager):
-    item_id = create_item(test_client, locale="fi")
+    item_id = create_item(test_client)
 
     resp = test_client.post(
         f"/v1/items/{item_id}/translations",
-        json={"target_lang": "en"},
+        content=EN_BODY,
+        headers=JSON_HEADERS,
     )
 
     assert resp.status_code == 200
@@ -36,7 +46,7 @@ def test_translation_success_with_stub_provider(test_client, translation_manager
 
 
 def test_audio_refresh_enqueues_task(test_client, task_manager):
-    item_id = create_item(test_client, locale="fi")
+    item_id = create_item(test_client)
 
     resp = test_client.post(f"/v1/items/{item_id}/audio/refresh")
     assert resp.status_code == 202
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import inspect
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, Optional
 
+import httpx
 import pytest
+import pytest_asyncio
+from fastapi import APIRouter
 from fastapi.testclient import TestClient
 from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.api import dependencies as dependency_cache
 from app.api.dependencies import (
@@ -28,13 +37,20 @@ from app.api.routes import translations as translations_routes
 from app.core.config import settings
 from app.core.security import reset_rate_limiter_state
 from app.main import app
-from app.models.database_manager import Base, DatabaseManager
+from app.models.database_manager import DatabaseManager
+from app.services import attempts_service as attempts_module
 from app.services.attempts_service import AttemptsService
 from app.services.item_audio_manager import ItemAudioManager
 from app.services.items_service import ItemsService
 from app.services.metadata_service import MetadataService
 from app.services.stats_service import StatsService
 from app.services.tags_service import TagsService
+from app.tts_engine.tts_engine_manager import TTSEngineManager
+from tests._factories import clear_tables, relax_sqlite_durability
+
+MEMORY_DB_URL = "sqlite://"
+
+_SUBMIT_TASK_FOR_ITEM = inspect.signature(TTSEngineManager.submit_task_for_item)
 
 
 class DummyTaskManager:
@@ -42,12 +58,19 @@ class DummyTaskManager:
 
     def __init__(self):
         self.is_initialized = True
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget recorded submissions and restore the default task id."""
         self.submissions: list[tuple[tuple, Dict]] = []
+        # Task id handed back for every submission; None simulates a rejection
+        self.next_task_id: Optional[str] = "test-task"
 
     def submit_task_for_item(self, *args, **kwargs):
+        # Fail like a spec'd mock would if callers drift from the real signature
+        _SUBMIT_TASK_FOR_ITEM.bind(self, *args, **kwargs)
         self.submissions.append((args, kwargs))
-        # Simulate a successful submission by default
-        return kwargs.get("task_id", "test-task")
+        return self.next_task_id
 
     def start_monitoring(self):  # pragma: no cover - not used in tests
         return None
@@ -56,6 +79,20 @@ class DummyTaskManager:
         return None
 
 
+class InlineExecutor:
+    """Executor stand-in that runs submissions on the caller's thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        return None
+
+
+# Stateless, so every audio manager in the session can share it
+_INLINE_EXECUTOR = InlineExecutor()
+
+
 class DummyTTSEngine:
     """Simple TTS engine stub exposing the attributes health checks expect."""
 
@@ -69,6 +106,19 @@ class DummyTTSEngine:
         self.is_initialized = False
 
 
+_TRANSLATION_TEMPLATE = MappingProxyType(
+    {
+        "translation_id": 1,
+        "text": "hello",
+        "source_lang": "fi",
+        "translated_text": "hola",
+        "provider": "stub",
+        "cached": False,
+        "status": "completed",
+    }
+)
+
+
 class DummyTranslationManager:
     """Stub translation manager to avoid real provider calls."""
 
@@ -82,19 +132,14 @@ class DummyTranslationManager:
         # block same-lang
         if target_lang == "fi":
             return None
+        now = datetime.now()
         return {
-            "translation_id": 1,
+            **_TRANSLATION_TEMPLATE,
             "item_id": item_id,
-            "text": "hello",
-            "source_lang": "fi",
             "target_lang": target_lang,
-            "translated_text": "hola",
-            "provider": "stub",
-            "cached": False,
-            "status": "completed",
-            "created_at": datetime.now(),
-            "updated_at": datetime.now(),
-            "last_refreshed_at": datetime.now(),
+            "created_at": now,
+            "updated_at": now,
+            "last_refreshed_at": now,
             "metadata": {},
         }
 
@@ -107,6 +152,34 @@ class DummyTranslationManager:
         return None
 
 
+error_router = APIRouter()
+
+
+@error_router.get("/test-error")
+def trigger_error():
+    raise RuntimeError("boom!")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def error_route() -> None:
+    """Mount ``/test-error`` once per session for the exception-handler tests."""
+
+    if not any(route.path == "/test-error" for route in app.routes):
+        app.include_router(error_router)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def manual_wer_scoring() -> Iterable[None]:
+    """Score attempts with the built-in WER path whether or not jiwer is installed."""
+
+    original = attempts_module.HAS_JIWER
+    attempts_module.HAS_JIWER = False
+    try:
+        yield
+    finally:
+        attempts_module.HAS_JIWER = original
+
+
 @pytest.fixture(autouse=True)
 def reset_dependency_singletons():
     """Ensure global dependency caches do not leak between tests."""
@@ -118,33 +191,192 @@ def reset_dependency_singletons():
     reset_rate_limiter_state()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def audio_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterable[Path]:
+    """Keep audio files written or probed by the app out of the working tree."""
+
+    path = tmp_path_factory.mktemp("audio")
+    original = settings.audio_dir
+    settings.audio_dir = str(path)
+    try:
+        yield path
+    finally:
+        settings.audio_dir = original
+
+
+@pytest.fixture()
+def audio_file(tmp_path: Path) -> Callable[[int], Path]:
+    """Serve item audio from a per-test dir and place ``item_<id>.wav`` in it."""
+
+    app.dependency_overrides[items_routes.get_audio_dir] = lambda: str(tmp_path)
+
+    def _create(item_id: int, content: bytes = b"RIFF") -> Path:
+        path = tmp_path / f"item_{item_id}.wav"
+        path.write_bytes(content)
+        return path
+
+    return _create
+
+
 @pytest.fixture(scope="session")
-def test_db_url(tmp_path_factory: pytest.TempPathFactory) -> str:
-    db_path = tmp_path_factory.mktemp("db") / "test.sqlite"
+def test_db_url(tmp_path_factory: pytest.TempPathFactory, worker_id: str) -> str:
+    # One database file per xdist worker so parallel workers never share a writer
+    db_path = tmp_path_factory.mktemp("db") / f"test-{worker_id}.sqlite"
     return f"sqlite:///{db_path}"
 
 
-@pytest.fixture()
-def db_manager(test_db_url: str) -> Iterable[DatabaseManager]:
+@contextmanager
+def _rolled_back(manager: DatabaseManager) -> Iterator[DatabaseManager]:
+    """Run ``manager``'s sessions inside one outer transaction, then roll it back.
+
+    Service commits only release savepoints, so nothing outlives the block.
+    """
+
+    session_factory = manager.SessionLocal
+    conn = manager.engine.connect()
+    outer = conn.begin()
+    manager.SessionLocal = sessionmaker(
+        bind=conn,
+        autocommit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield manager
+    finally:
+        manager.SessionLocal = session_factory
+        outer.rollback()
+        conn.close()
+
+
+def _build_items_service(
+    db_manager: DatabaseManager,
+    task_manager: DummyTaskManager,
+    stats_service: Optional[StatsService] = None,
+) -> ItemsService:
+    audio_manager = ItemAudioManager(db_manager, task_manager)
+    # Submit TTS requests inline: no worker threads to hand off to or join, and
+    # every submission is recorded before the call that scheduled it returns
+    audio_manager._executor.shutdown(wait=False)
+    audio_manager._executor = _INLINE_EXECUTOR
+    return ItemsService(
+        db_manager,
+        task_manager,
+        audio_manager,
+        on_attempts_changed=(
+            stats_service.clear_summary_cache if stats_service else None
+        ),
+    )
+
+
+def _warm_statement_cache(manager: DatabaseManager) -> None:
+    """Compile the services' common statements once per worker.
+
+    The engine's compiled cache keys on statement shape, so running the real
+    service calls (rolled back afterwards) spares the first tests that use
+    them the compile step.
+    """
+
+    with _rolled_back(manager):
+        items_service = _build_items_service(manager, DummyTaskManager())
+        attempts_service = AttemptsService(manager)
+        stats_service = StatsService(manager)
+        try:
+            item_id = items_service.create_item(
+                locale=settings.tts_supported_languages[0], text="warm up"
+            )["id"]
+            items_service.get_item(item_id)
+            items_service.list_items()
+            attempts_service.create_attempt(item_id, "warm up")
+            attempts_service.list_attempts(item_id=item_id)
+            stats_service.get_summary_stats()
+            stats_service.get_practice_log()
+            items_service.delete_item(item_id)
+        finally:
+            items_service.audio_manager.shutdown()
+
+
+@pytest.fixture(scope="session")
+def memory_db_manager() -> Iterable[DatabaseManager]:
+    """One in-memory database per worker; the schema is created once."""
+
+    manager = DatabaseManager(MEMORY_DB_URL)
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT; let SQLAlchemy
+    # emit it (the documented pysqlite transaction recipe)
+    @event.listens_for(manager.engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    with manager.engine.connect() as conn:
+        conn.connection.driver_connection.isolation_level = None
+
+    _warm_statement_cache(manager)
+    try:
+        yield manager
+    finally:
+        manager.close()
+
+
+@pytest.fixture(scope="session")
+def file_db_manager(test_db_url: str) -> Iterable[DatabaseManager]:
+    """File-backed database for ``file_db`` tests; the schema is created once."""
+
     manager = DatabaseManager(test_db_url)
-    Base.metadata.drop_all(bind=manager.engine)
-    Base.metadata.create_all(bind=manager.engine)
+    relax_sqlite_durability(manager.engine)
     try:
         yield manager
     finally:
         manager.close()
 
 
+@pytest.fixture()
+def db_manager(request: pytest.FixtureRequest) -> Iterable[DatabaseManager]:
+    """The worker's session-scoped database, reset for every test.
+
+    Schema DDL runs once per worker. In-memory tests roll back their writes;
+    ``file_db`` tests start from emptied tables instead.
+    """
+
+    if request.node.get_closest_marker("file_db"):
+        # Concurrent writers need real connections, not one shared in-memory one
+        manager = request.getfixturevalue("file_db_manager")
+        clear_tables(manager.engine)
+        yield manager
+        return
+
+    with _rolled_back(request.getfixturevalue("memory_db_manager")) as manager:
+        yield manager
+
+
+@pytest.fixture()
+def session(db_manager: DatabaseManager) -> Iterable[Session]:
+    """One session for a test's own seeding and verification reads.
+
+    Call ``session.expire_all()`` before re-reading rows a service changed.
+    """
+
+    with db_manager.get_session() as test_session:
+        yield test_session
+
+
 @pytest.fixture()
 def tags_service(db_manager: DatabaseManager) -> TagsService:
     return TagsService(db_manager)
 
 
-@pytest.fixture()
-def task_manager() -> DummyTaskManager:
+@pytest.fixture(scope="session")
+def _shared_task_manager() -> DummyTaskManager:
     return DummyTaskManager()
 
 
+@pytest.fixture()
+def task_manager(_shared_task_manager: DummyTaskManager) -> DummyTaskManager:
+    # Built once per worker; each test starts from a clean recording
+    _shared_task_manager.reset()
+    return _shared_task_manager
+
+
 @pytest.fixture()
 def translation_manager() -> DummyTranslationManager:
     return DummyTranslationManager()
@@ -157,28 +389,60 @@ def dummy_tts_engine() -> DummyTTSEngine:
 
 @pytest.fixture()
 def items_service(
-    db_manager: DatabaseManager, task_manager: DummyTaskManager
+    db_manager: DatabaseManager,
+    task_manager: DummyTaskManager,
+    stats_service: StatsService,
 ) -> Iterable[ItemsService]:
-    audio_manager = ItemAudioManager(db_manager, task_manager)
-    service = ItemsService(db_manager, task_manager, audio_manager)
+    service = _build_items_service(db_manager, task_manager, stats_service)
     try:
         yield service
     finally:
-        audio_manager.shutdown()
+        service.audio_manager.shutdown()
 
 
 @pytest.fixture()
-def attempts_service(db_manager: DatabaseManager) -> AttemptsService:
-    return AttemptsService(db_manager)
+def stats_service(db_manager: DatabaseManager) -> StatsService:
+    return StatsService(db_manager)
 
 
 @pytest.fixture()
-def stats_service(db_manager: DatabaseManager) -> StatsService:
-    return StatsService(db_manager)
+def attempts_service(
+    db_manager: DatabaseManager, stats_service: StatsService
+) -> AttemptsService:
+    return AttemptsService(
+        db_manager, on_attempts_changed=stats_service.clear_summary_cache
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_test_client() -> Iterable[TestClient]:
+    """One TestClient per session; per-test wiring lives in ``test_client``."""
+
+    client = TestClient(app, raise_server_exceptions=False)
+    # Build Starlette's middleware stack up front, outside any test body.
+    # No API key is sent, so this never reaches a route or the database.
+    client.get("/health")
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides() -> Iterable[None]:
+    """Snapshot ``app.dependency_overrides`` and put it back after each test."""
+
+    snapshot = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(snapshot)
 
 
 @pytest.fixture()
 def test_client(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    shared_test_client: TestClient,
     db_manager: DatabaseManager,
     items_service: ItemsService,
     attempts_service: AttemptsService,
@@ -188,7 +452,12 @@ def test_client(
     dummy_tts_engine: DummyTTSEngine,
     translation_manager: DummyTranslationManager,
 ):
-    settings.api_keys = ["test-suite-key"]
+    if request.node.get_closest_marker("unit"):
+        pytest.fail("tests marked 'unit' must not use the HTTP client")
+
+    # Scoped to the test: xdist decides which modules later share this worker
+    monkeypatch.setattr(settings, "api_keys", ["test-suite-key"])
+    metadata_service = MetadataService(db_manager, task_manager)
 
     overrides = {
         get_database_manager: lambda: db_manager,
@@ -199,23 +468,30 @@ def test_client(
         get_tts_engine_manager: lambda: task_manager,
         get_tts_engine: lambda: dummy_tts_engine,
         get_translation_manager: lambda: translation_manager,
-        get_metadata_service: lambda: MetadataService(db_manager, task_manager),
+        get_metadata_service: lambda: metadata_service,
         # Route-level wrappers
         attempts_routes.get_attempts_service: lambda: attempts_service,
         stats_routes.get_stats_service: lambda: stats_service,
         items_routes.get_items_service: lambda: items_service,
         translations_routes.get_translation_manager: lambda: translation_manager,
-        metadata_routes.get_metadata_service: lambda: MetadataService(
-            db_manager, task_manager
-        ),
+        metadata_routes.get_metadata_service: lambda: metadata_service,
     }
 
     app.dependency_overrides.update(overrides)
-    client = TestClient(app, raise_server_exceptions=False)
+    shared_test_client.headers.update(
+        {settings.api_key_header_name: settings.api_keys[0]}
+    )
 
-    client.headers.update({settings.api_key_header_name: settings.api_keys[0]})
+    return shared_test_client
 
-    try:
+
+@pytest_asyncio.fixture()
+async def async_client(test_client: TestClient) -> AsyncIterator[httpx.AsyncClient]:
+    """In-process async client sharing ``test_client``'s overrides and headers."""
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+        headers=test_client.headers,
+    ) as client:
         yield client
-    finally:
-        app.dependency_overrides.clear()
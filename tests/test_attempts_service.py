@@ -1,41 +1,80 @@
 """Tests for AttemptsService scoring and filtering behavior."""
 
-from datetime import datetime, timedelta, timezone
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
-import app.services.attempts_service as attempts_module
-from app.models.models import Attempt, Item
+import pytest
+from sqlalchemy import select
 
+from app.models.models import Attempt, Item
+from app.services import attempts_service as attempts_module
+from tests._factories import make_item
 
-def _naive_utc_now() -> datetime:
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+# Naive local time, like the datetime.now default on created_at; fixed so
+# windows are exact
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
 
 
-def _create_item(
-    db_manager, *, locale="en-US", text="hello world", difficulty=1
-) -> Item:
-    with db_manager.get_session() as session:
-        item = Item(locale=locale, text=text, difficulty=difficulty)
-        session.add(item)
-        session.commit()
-        session.refresh(item)
-        return item
+def _attempt(item_id: int, text: str, *, created_at: datetime) -> Attempt:
+    return Attempt(
+        item_id=item_id,
+        text=text,
+        percentage=100,
+        wer=0.0,
+        words_ref=2,
+        words_correct=2,
+        created_at=created_at,
+    )
 
 
-def test_create_attempt_normalizes_text(db_manager, attempts_service, monkeypatch):
+def test_create_attempt_normalizes_text(db_manager, attempts_service):
     """Ensure scoring ignores accents/punctuation and persists attempts."""
 
-    monkeypatch.setattr(attempts_module, "HAS_JIWER", False)
-    item = _create_item(db_manager, text="Café, world!")
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="Café, world!").id
+        session.commit()
 
-    attempt = attempts_service.create_attempt(item.id, "Cafe world")
+    attempt = attempts_service.create_attempt(item_id, "Cafe world")
 
     assert attempt is not None
-    assert attempt.item_id == item.id
+    assert attempt.item_id == item_id
     assert attempt.words_ref == 2
     assert attempt.words_correct == 2
     assert attempt.percentage == 100
 
 
+def test_create_attempt_scores_against_cached_tokens(db_manager, attempts_service):
+    with db_manager.get_session() as session:
+        item = make_item(session, text="Café, world!")
+        item.normalized_tokens = ["cafe", "world", "again"]
+        item_id = item.id
+        session.commit()
+
+    attempt = attempts_service.create_attempt(item_id, "Cafe world")
+
+    assert attempt.words_ref == 3
+    assert attempt.words_correct == 2
+
+
+def test_calculate_score_uses_jiwer_hits(monkeypatch, attempts_service):
+    calls = []
+
+    def fake_process_words(reference, hypothesis):
+        calls.append((reference, hypothesis))
+        return SimpleNamespace(wer=0.5, hits=1)
+
+    monkeypatch.setattr(attempts_module, "HAS_JIWER", True)
+    monkeypatch.setattr(
+        attempts_module, "process_words", fake_process_words, raising=False
+    )
+
+    result = attempts_service._calculate_score("Hei, maailma!", "hei")
+
+    assert calls == [("hei maailma", "hei")]
+    assert result == {"wer": 0.5, "percentage": 50, "words_ref": 2, "words_correct": 1}
+
+
 def test_create_attempt_returns_none_when_item_missing(attempts_service):
     """Missing source items should short-circuit and return None."""
 
@@ -44,31 +83,202 @@ def test_create_attempt_returns_none_when_item_missing(attempts_service):
     assert result is None
 
 
-def test_list_attempts_filters_by_item_and_since(
-    db_manager, attempts_service, monkeypatch
-):
+def test_list_attempts_filters_by_item_and_since(db_manager, attempts_service):
     """Verify list_attempts honors item filter, since window, and pagination metadata."""
 
-    monkeypatch.setattr(attempts_module, "HAS_JIWER", False)
-    item_a = _create_item(db_manager, text="alpha beta")
-    item_b = _create_item(db_manager, text="gamma delta")
-
-    first_attempt = attempts_service.create_attempt(item_a.id, "alpha beta")
-    attempts_service.create_attempt(item_a.id, "alpha beta alpha")
-    attempts_service.create_attempt(item_b.id, "gamma delta")
-
-    cutoff = _naive_utc_now() - timedelta(hours=1)
+    now = FROZEN_NOW
+    cutoff = now - timedelta(hours=1)
+    # Scoring is covered above; seed items and rows in a single transaction
     with db_manager.get_session() as session:
-        attempt_model = session.get(Attempt, first_attempt.id)
-        attempt_model.created_at = cutoff - timedelta(days=1)
+        item_a_id = make_item(session, text="alpha beta").id
+        item_b_id = make_item(session, text="gamma delta").id
+        session.add_all(
+            [
+                _attempt(
+                    item_a_id, "alpha beta", created_at=cutoff - timedelta(days=1)
+                ),
+                _attempt(item_a_id, "alpha beta alpha", created_at=now),
+                _attempt(item_b_id, "gamma delta", created_at=now),
+            ]
+        )
         session.commit()
 
     result = attempts_service.list_attempts(
-        item_id=item_a.id, since=cutoff, page=1, per_page=5
+        item_id=item_a_id, since=cutoff, page=1, per_page=5
     )
 
     assert result["total"] == 1
     assert result["total_pages"] == 1
     assert len(result["attempts"]) == 1
-    assert result["attempts"][0]["item_id"] == item_a.id
-    assert result["attempts"][0]["created_at"] is not None
+    assert result["attempts"][0]["item_id"] == item_a_id
+    assert result["attempts"][0]["created_at"] == FROZEN_NOW
+
+
+def test_list_attempts_until_is_exclusive(db_manager, attempts_service):
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="alpha beta").id
+        session.add_all(
+            [
+                _attempt(
+                    item_id, "before", created_at=FROZEN_NOW - timedelta(seconds=1)
+                ),
+                _attempt(item_id, "boundary", created_at=FROZEN_NOW),
+            ]
+        )
+        session.commit()
+
+    result = attempts_service.list_attempts(item_id=item_id, until=FROZEN_NOW)
+
+    assert [attempt["text"] for attempt in result["attempts"]] == ["before"]
+    assert result["total"] == 1
+
+
+@pytest.mark.parametrize(
+    "ref,hyp,expected",
+    [
+        (["hei", "tama", "on", "testi"], ["hei", "tama", "on", "testi"], (0.0, 4)),
+        (["hei", "tama", "on", "testi"], ["hei", "testi"], (0.5, 2)),
+        (["hei", "tama", "on", "testi"], ["hei", "sina", "on", "testi"], (0.25, 3)),
+        (["alpha", "beta"], ["gamma", "delta", "epsilon"], (1.0, 0)),
+        (["a", "b", "c", "d"], ["a", "x", "c", "d"], (0.25, 3)),
+        (["alpha"], [], (1.0, 0)),
+        (["alpha"], ["alpha", "extra"], (1.0, 1)),
+        (["on", "on", "testi"], ["on", "testi", "testi"], (1 / 3, 2)),
+        ([], ["alpha"], (1.0, 0)),
+        (["one", "two", "three"], ["three", "two", "one"], (2 / 3, 1)),
+        (["hei", "tama", "on", "testi"], ["testi", "hei"], (1.0, 1)),
+    ],
+    ids=[
+        "exact",
+        "deletions",
+        "substitution",
+        "no-match",
+        "shared-prefix-suffix",
+        "empty-hyp",
+        "insertion",
+        "repeated-words",
+        "empty-ref",
+        "reordered",
+        "reordered-subset",
+    ],
+)
+@pytest.mark.parametrize(
+    "use_rapidfuzz",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not attempts_module.HAS_RAPIDFUZZ, reason="rapidfuzz not installed"
+            ),
+        ),
+    ],
+    ids=["python", "rapidfuzz"],
+)
+def test_calculate_wer_manual(
+    monkeypatch, attempts_service, use_rapidfuzz, ref, hyp, expected
+):
+    monkeypatch.setattr(attempts_module, "HAS_RAPIDFUZZ", use_rapidfuzz)
+
+    assert attempts_service._calculate_wer_manual(ref, hyp) == expected
+
+
+def test_create_attempts_bulk_scores_and_orders_rows(db_manager, attempts_service):
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="hei tama on testi").id
+        session.commit()
+
+    attempts = attempts_service.create_attempts_bulk(
+        item_id, ["hei tama on testi", "hei testi", "moi"]
+    )
+
+    assert [attempt.text for attempt in attempts] == [
+        "hei tama on testi",
+        "hei testi",
+        "moi",
+    ]
+    assert [attempt.percentage for attempt in attempts] == [100, 50, 0]
+    assert all(attempt.id is not None for attempt in attempts)
+    assert attempts_service.create_attempts_bulk(999999, ["hei"]) is None
+
+
+@pytest.mark.parametrize(
+    "page,expected_count",
+    [(1, 10), (3, 5), (4, 0)],
+    ids=["first", "last", "past-end"],
+)
+def test_list_attempts_paginates_with_total(
+    db_manager, attempts_service, page, expected_count
+):
+    with db_manager.get_session() as session:
+        item_id = make_item(session, text="alpha beta").id
+        session.add_all(
+            [
+                _attempt(
+                    item_id, "alpha beta", created_at=FROZEN_NOW - timedelta(minutes=i)
+                )
+                for i in range(25)
+            ]
+        )
+        session.commit()
+
+    result = attempts_service.list_attempts(page=page, per_page=10)
+
+    assert result["total"] == 25
+    assert result["total_pages"] == 3
+    assert len(result["attempts"]) == expected_count
+    assert all("total" not in attempt for attempt in result["attempts"])
+
+
+def test_reference_tokens_are_interned():
+    ref = attempts_module.reference_tokens("Hei maailma")
+    hyp = attempts_module._hypothesis_tokens("hei, MAAILMA!")
+
+    assert ref == hyp == ("hei", "maailma")
+    assert all(word is sys.intern(word) for word in ref)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 2], ids=["in-process", "pooled"])
+def test_rescore_all_recomputes_stored_scores(
+    monkeypatch, session, attempts_service, chunk_size
+):
+    # Two chunks of two run on a real spawned process pool
+    monkeypatch.setattr(attempts_module, "RESCORE_CHUNK_SIZE", chunk_size)
+    item = make_item(session, text="hei tama on testi")
+    item_id = item.id
+    # Stale scores, as if written under older scoring rules
+    session.add_all(
+        [
+            _attempt(item_id, text, created_at=FROZEN_NOW)
+            for text in ["hei tama on testi", "hei testi", "moi", "hei"]
+        ]
+    )
+    session.commit()
+
+    assert attempts_service.rescore_all(item_id, max_workers=2) == 4
+
+    session.expire_all()
+    rows = session.execute(
+        select(Attempt.text, Attempt.percentage).order_by(Attempt.id)
+    ).all()
+    assert [percentage for _, percentage in rows] == [100, 50, 0, 25]
+    assert session.get(Item, item_id).normalized_tokens == [
+        "hei",
+        "tama",
+        "on",
+        "testi",
+    ]
+    assert attempts_service.rescore_all(999999) is None
+
+
+def test_reference_token_cache_evicts_and_tracks_text(monkeypatch, attempts_service):
+    monkeypatch.setattr(attempts_module, "REF_CACHE_SIZE", 2)
+    items = [Item(id=i, text=f"word{i}") for i in range(3)]
+
+    for item in items:
+        attempts_service._get_ref_tokens(item)
+    assert list(attempts_service._ref_cache) == [1, 2]
+
+    # Same id, new text: the stale entry must not be served
+    items[2].text = "edited text"
+    assert attempts_service._get_ref_tokens(items[2]) == ("edited", "text")
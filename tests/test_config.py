@@ -1,21 +1,36 @@
 """Tests for application configuration helpers."""
 
-from app.core.config import Settings
-
+import pytest
 
-def test_settings_production_flags():
-    settings = Settings(environment="production", cors_origins="https://example.com")
+from app.core.config import Settings
 
-    assert settings.is_development is False
-    assert settings.is_production is True
-    assert settings.reload is False
-    assert settings.app_name == "Last Whisper Backend"
+pytestmark = pytest.mark.unit
 
 
-def test_settings_development_flags():
-    settings = Settings(environment="dev")
+@pytest.mark.parametrize(
+    "overrides,is_dev,is_prod,reload,app_name",
+    [
+        (
+            {"environment": "production", "cors_origins": "https://example.com"},
+            False,
+            True,
+            False,
+            "Last Whisper Backend",
+        ),
+        (
+            {"environment": "dev"},
+            True,
+            False,
+            True,
+            "Last Whisper Backend (Development)",
+        ),
+    ],
+    ids=["production", "development"],
+)
+def test_settings_environment_flags(overrides, is_dev, is_prod, reload, app_name):
+    settings = Settings(**overrides)
 
-    assert settings.is_development is True
-    assert settings.is_production is False
-    assert settings.reload is True
-    assert settings.app_name.endswith(" (Development)")
+    assert settings.is_development is is_dev
+    assert settings.is_production is is_prod
+    assert settings.reload is reload
+    assert settings.app_name == app_name
@@ -1,7 +1,13 @@
 """Tests for the DatabaseManager helpers."""
 
+from datetime import datetime
+
+import pytest
+from sqlalchemy.pool import StaticPool
+
 from app.core.config import settings
 from app.models.database_manager import DatabaseManager
+from app.models.models import Item, Task
 
 
 def test_database_manager_creates_sqlite_parent_dir(tmp_path, monkeypatch):
@@ -17,3 +23,59 @@ def test_database_manager_creates_sqlite_parent_dir(tmp_path, monkeypatch):
         assert db_file.exists()
     finally:
         manager.close()
+
+
+@pytest.mark.parametrize(
+    "database_url",
+    [
+        "sqlite://",
+        "sqlite:///:memory:",
+        "sqlite:///file::memory:?cache=shared&uri=true",
+        "sqlite:///file:memdb_test?mode=memory&cache=shared&uri=true",
+    ],
+    ids=["default", "memory", "shared-cache-uri", "named-memory-uri"],
+)
+def test_database_manager_in_memory_sessions_share_one_database(database_url):
+    manager = DatabaseManager(database_url=database_url)
+    assert isinstance(manager.engine.pool, StaticPool)
+
+    try:
+        with manager.get_session() as session:
+            session.add(Item(locale="fi", text="hei", difficulty=1))
+            session.commit()
+
+        # A second session (and pool checkout) must see the same schema and rows
+        with manager.get_session() as session:
+            assert session.query(Item).count() == 1
+    finally:
+        manager.close()
+
+
+def test_database_manager_task_lookups():
+    manager = DatabaseManager(database_url="sqlite://")
+
+    try:
+        with manager.get_session() as session:
+            session.add_all(
+                [
+                    Task(
+                        task_id=f"task-{i}",
+                        original_text="hei",
+                        text_hash="hash",
+                        status=status,
+                        created_at=datetime(2025, 1, 1, 12, i),
+                    )
+                    for i, status in enumerate(["done", "queued", "done"])
+                ]
+            )
+            session.commit()
+
+        assert manager.get_task_by_id("task-1").status == "queued"
+        assert manager.get_task_by_id("missing") is None
+        assert [task.task_id for task in manager.get_all_tasks(status="done")] == [
+            "task-2",
+            "task-0",
+        ]
+        assert len(manager.get_all_tasks(limit=2)) == 2
+    finally:
+        manager.close()
@@ -0,0 +1,99 @@
+"""Read-only ItemsService.list_items tests sharing one seeded corpus."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.models import Item
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+BASIC_TAGS = ["test", "basic"]
+ADVANCED_TAGS = ["advanced", "complex"]
+
+# Ten items alternating fi/en, difficulties cycling 1..5, one minute apart
+SEED_ITEMS = tuple(
+    {
+        "locale": "fi" if i % 2 == 0 else "en",
+        "text": f"Testi {i}",
+        "difficulty": i % 5 + 1,
+        "tags_json": json.dumps(BASIC_TAGS if i % 5 < 2 else ADVANCED_TAGS),
+        "created_at": BASE_TIME + timedelta(minutes=i),
+        "updated_at": BASE_TIME + timedelta(minutes=i),
+    }
+    for i in range(10)
+)
+SEED_DIFFICULTIES = sorted(row["difficulty"] for row in SEED_ITEMS)
+
+# Seed and clean up through Core: plain rows, no identity map or unit of work
+ITEMS_TABLE = Item.__table__
+
+
+@pytest.fixture(scope="module")
+def seeded_items(memory_db_manager):
+    """Insert ``SEED_ITEMS`` once for the module; tests must not modify them."""
+
+    with memory_db_manager.get_session() as session:
+        ids = session.scalars(
+            ITEMS_TABLE.insert().returning(
+                ITEMS_TABLE.c.id, sort_by_parameter_order=True
+            ),
+            list(SEED_ITEMS),
+        ).all()
+        session.commit()
+    try:
+        yield ids
+    finally:
+        with memory_db_manager.get_session() as session:
+            session.execute(ITEMS_TABLE.delete().where(ITEMS_TABLE.c.id.in_(ids)))
+            session.commit()
+
+
+def test_list_items_with_pagination(seeded_items, items_service):
+    result = items_service.list_items(page=3, per_page=4)
+
+    assert result["total"] == len(SEED_ITEMS)
+    assert result["total_pages"] == 3
+    assert len(result["items"]) == 2
+
+
+def test_list_items_with_locale_filter(seeded_items, items_service):
+    result = items_service.list_items(locale="en")
+
+    assert result["total"] == 5
+    assert {item["locale"] for item in result["items"]} == {"en"}
+
+
+def test_list_items_with_tags_filter(seeded_items, items_service):
+    result = items_service.list_items(tags=["advanced"])
+
+    assert result["total"] == 6
+    assert all(item["tags"] == ADVANCED_TAGS for item in result["items"])
+
+
+def test_list_items_with_difficulty_filter_range(seeded_items, items_service):
+    result = items_service.list_items(difficulty="2..4", sort="difficulty.asc")
+
+    assert [item["difficulty"] for item in result["items"]] == [2, 2, 3, 3, 4, 4]
+    assert result["total"] == 6
+
+
+@pytest.mark.parametrize(
+    "sort,field,descending",
+    [
+        ("created_at.asc", "id", False),
+        ("created_at.desc", "id", True),
+        ("difficulty.asc", "difficulty", False),
+        ("difficulty.desc", "difficulty", True),
+        # Unknown values fall back to the default newest-first ordering
+        ("invalid_sort", "id", True),
+    ],
+)
+def test_list_items_with_sorting(seeded_items, items_service, sort, field, descending):
+    result = items_service.list_items(sort=sort, per_page=len(SEED_ITEMS))
+
+    expected = seeded_items if field == "id" else SEED_DIFFICULTIES
+    assert [item[field] for item in result["items"]] == sorted(
+        expected, reverse=descending
+    )
+    assert result["total"] == len(SEED_ITEMS)
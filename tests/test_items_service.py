@@ -1,36 +1,33 @@
-"""Tests for ItemsService TTS scheduling helpers."""
+"""Tests for ItemsService creation and TTS scheduling helpers."""
+
+from types import MappingProxyType
 
 import pytest
+from sqlalchemy import event, exists, select
+from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.models.enums import ItemTTSStatus
 from app.models.models import Item
+from tests._factories import make_item
 
 SUPPORTED_TTS_LOCALE = settings.tts_supported_languages[0]
 
-
-@pytest.fixture()
-def immediate_scheduler(monkeypatch, items_service):
-    original = items_service.audio_manager.schedule_generation
-
-    def _immediate(self, item_id, text, locale):
-        return self._submit_request(item_id, text, locale)
-
-    bound = _immediate.__get__(
-        items_service.audio_manager, type(items_service.audio_manager)
-    )
-    monkeypatch.setattr(items_service.audio_manager, "schedule_generation", bound)
-    return original
+# create_item kwargs shared by tests that only need some valid item
+ITEM_FI = MappingProxyType(
+    {
+        "locale": SUPPORTED_TTS_LOCALE,
+        "text": "Hei, maailma! Tämä on testi.",
+        "tags": ("test", "basic"),
+    }
+)
 
 
-def test_create_item_submits_tts_with_locale(
-    items_service, task_manager, immediate_scheduler
-):
-    payload = items_service.create_item(
-        locale=SUPPORTED_TTS_LOCALE, text="hello world example text"
-    )
+def test_create_item_submits_tts_with_locale(items_service, task_manager):
+    payload = items_service.create_item(**ITEM_FI)
 
     assert payload["tts_status"] == ItemTTSStatus.PENDING
+    assert payload["tags"] == list(ITEM_FI["tags"])
     assert len(task_manager.submissions) == 1
 
     submission_args, _ = task_manager.submissions[0]
@@ -39,13 +36,9 @@ def test_create_item_submits_tts_with_locale(
 
 
 def test_bulk_create_marks_failed_when_submission_missing(
-    items_service, task_manager, db_manager, immediate_scheduler, monkeypatch
+    items_service, task_manager, db_manager
 ):
-    monkeypatch.setattr(
-        task_manager,
-        "submit_task_for_item",
-        lambda *args, **kwargs: None,
-    )
+    task_manager.next_task_id = None
 
     result = items_service.bulk_create_items(
         [
@@ -57,5 +50,68 @@ def test_bulk_create_marks_failed_when_submission_missing(
     assert len(result["created_items"]) == 2
 
     with db_manager.get_session() as session:
-        statuses = {item.tts_record.status for item in session.query(Item).all()}
+        items = session.scalars(select(Item).options(selectinload(Item.tts_record)))
+        statuses = {item.tts_record.status for item in items}
         assert statuses == {ItemTTSStatus.FAILED}
+
+
+def test_create_item_caches_normalized_tokens(items_service, db_manager):
+    payload = items_service.create_item(**ITEM_FI)
+
+    with db_manager.get_session() as session:
+        item = session.get(Item, payload["id"])
+        assert item.normalized_tokens == ["hei", "maailma", "tama", "on", "testi"]
+
+
+def test_create_item_issues_only_the_two_inserts(items_service, db_manager):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        verb = statement.split()[0]
+        # Savepoint bookkeeping from the test transaction is not the service's
+        if verb in {"INSERT", "SELECT", "UPDATE", "DELETE"}:
+            statements.append(verb)
+
+    event.listen(db_manager.engine, "before_cursor_execute", _record)
+    try:
+        items_service.create_item(**ITEM_FI)
+    finally:
+        event.remove(db_manager.engine, "before_cursor_execute", _record)
+
+    # No refresh or lazy-load SELECTs around the item and ItemTTS inserts
+    assert statements == ["INSERT", "INSERT"]
+
+
+@pytest.mark.parametrize("has_audio", [True, False], ids=["with-audio", "no-audio"])
+def test_delete_item_removes_audio_when_present(
+    items_service, db_manager, audio_dir, has_audio
+):
+    item = items_service.create_item(**ITEM_FI)
+    audio_path = audio_dir / f"item_{item['id']}.wav"
+    if has_audio:
+        audio_path.write_bytes(b"RIFF")
+
+    assert items_service.delete_item(item["id"]) is True
+
+    assert not audio_path.exists()
+    with db_manager.get_session() as session:
+        assert not session.scalar(select(exists().where(Item.id == item["id"])))
+
+
+def test_item_to_dict_reads_flushed_item_without_refresh(items_service, session):
+    # Column defaults are applied at flush, so no commit/refresh round trip
+    item = make_item(session, locale="fi", text="Hei", difficulty=2, tags=["a"])
+
+    payload = items_service._item_to_dict(item)
+
+    assert payload == {
+        "id": item.id,
+        "locale": "fi",
+        "text": "Hei",
+        "difficulty": 2,
+        "tags": ["a"],
+        "tts_status": None,
+        "created_at": item.created_at.isoformat(),
+        "updated_at": item.updated_at.isoformat(),
+        "practiced": False,
+    }
@@ -5,10 +5,17 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
-from app.core.runtime_state import set_app_started_at
+import pytest
+
+from app.core.runtime_state import get_uptime_seconds, set_app_started_at
 from app.models.enums import MetadataDetailLevel
+from app.services import metadata_service as metadata_module
 from app.services.metadata_service import MetadataService
 
+pytestmark = pytest.mark.unit
+
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
 
 class _DummyDBManager:
     def __init__(self):
@@ -20,8 +27,22 @@ class _DummyTTSManager:
         return {"worker_running": True, "queue_size": 0}
 
 
-def test_metadata_service_returns_core_sections():
-    set_app_started_at(datetime.now(timezone.utc) - timedelta(seconds=5))
+@pytest.fixture(scope="module")
+def metadata_payload():
+    """Full payload shared by the read-only language-listing tests."""
+
+    service = MetadataService(_DummyDBManager(), _DummyTTSManager(), cache_ttl=1)
+    return service.get_metadata()
+
+
+def test_metadata_service_returns_core_sections(monkeypatch):
+    # Pin the clock so uptime is an exact value rather than a wall-clock delta
+    set_app_started_at(FROZEN_NOW - timedelta(seconds=5))
+    monkeypatch.setattr(
+        metadata_module,
+        "get_uptime_seconds",
+        lambda: get_uptime_seconds(now=FROZEN_NOW),
+    )
     service = MetadataService(_DummyDBManager(), _DummyTTSManager(), cache_ttl=1)
 
     payload = service.get_metadata()
@@ -30,7 +51,7 @@ def test_metadata_service_returns_core_sections():
     assert payload.build.commit
     assert payload.providers.database["engine"] == "sqlite"
     assert payload.runtime is not None
-    assert payload.runtime.uptime_seconds >= 0
+    assert payload.runtime.uptime_seconds == 5.0
 
 
 def test_metadata_service_respects_field_filter():
@@ -43,11 +64,8 @@ def test_metadata_service_respects_field_filter():
     assert payload.build is None
 
 
-def test_metadata_service_translation_languages_structured():
-    service = MetadataService(_DummyDBManager(), _DummyTTSManager(), cache_ttl=1)
-    payload = service.get_metadata()
-
-    translation_languages = payload.features.get("translation_languages")
+def test_metadata_service_translation_languages_structured(metadata_payload):
+    translation_languages = metadata_payload.features.get("translation_languages")
     assert isinstance(translation_languages, list)
     assert translation_languages == [
         {"language_code": "en", "language_name": "English"},
@@ -57,11 +75,10 @@ def test_metadata_service_translation_languages_structured():
     ]
 
 
-def test_metadata_service_provider_translation_languages_structured():
-    service = MetadataService(_DummyDBManager(), _DummyTTSManager(), cache_ttl=1)
-    payload = service.get_metadata()
-
-    translation_supported = payload.providers.translation["supported_languages"]
+def test_metadata_service_provider_translation_languages_structured(metadata_payload):
+    translation_supported = metadata_payload.providers.translation[
+        "supported_languages"
+    ]
     assert translation_supported == [
         {"language_code": "en", "language_name": "English"},
         {"language_code": "fi", "language_name": "Suomi"},
@@ -70,11 +87,8 @@ def test_metadata_service_provider_translation_languages_structured():
     ]
 
 
-def test_metadata_service_provider_tts_languages_structured():
-    service = MetadataService(_DummyDBManager(), _DummyTTSManager(), cache_ttl=1)
-    payload = service.get_metadata()
-
-    tts_supported = payload.providers.tts["supported_languages"]
+def test_metadata_service_provider_tts_languages_structured(metadata_payload):
+    tts_supported = metadata_payload.providers.tts["supported_languages"]
     assert tts_supported == [
         {"language_code": "fi", "language_name": "Suomi"},
     ]
@@ -1,7 +1,24 @@
+import pytest
 from fastapi.testclient import TestClient
 
+from app.core import security
 from app.core.config import settings
-from app.core.security import reset_rate_limiter_state
+from app.core.security import RateLimiter, get_rate_limiter
+from app.main import app
+from app.services.exceptions import RateLimitExceeded
+
+
+class FakeLimiter:
+    """Allows ``max_calls`` hits in total, regardless of key or window."""
+
+    def __init__(self, max_calls: int):
+        self.max_calls = max_calls
+        self.calls = 0
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> None:
+        self.calls += 1
+        if self.calls > self.max_calls:
+            raise RateLimitExceeded("Rate limit exceeded")
 
 
 def test_missing_api_key_is_rejected(test_client: TestClient):
@@ -17,19 +34,29 @@ def test_missing_api_key_is_rejected(test_client: TestClient):
 
 
 def test_rate_limit_blocks_excess_requests(test_client: TestClient):
-    prev_limit = settings.api_rate_limit_per_minute
-    prev_window = settings.api_rate_limit_window_seconds
-    settings.api_rate_limit_per_minute = 1
-    settings.api_rate_limit_window_seconds = 60
-    reset_rate_limiter_state()
-
-    try:
-        first = test_client.get("/v1/items")
-        assert first.status_code == 200
-
-        second = test_client.get("/v1/items")
-        assert second.status_code == 429
-    finally:
-        settings.api_rate_limit_per_minute = prev_limit
-        settings.api_rate_limit_window_seconds = prev_window
-        reset_rate_limiter_state()
+    limiter = FakeLimiter(max_calls=1)
+    app.dependency_overrides[get_rate_limiter] = lambda: limiter
+
+    first = test_client.get("/v1/items")
+    assert first.status_code == 200
+
+    second = test_client.get("/v1/items")
+    assert second.status_code == 429
+    assert second.json()["detail"] == "Rate limit exceeded"
+
+
+def test_rate_limiter_allows_limit_then_rejects_within_window(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(security, "monotonic", lambda: now)
+    limiter = RateLimiter()
+
+    for _ in range(3):
+        limiter.hit("client", limit=3, window_seconds=60)
+    with pytest.raises(RateLimitExceeded):
+        limiter.hit("client", limit=3, window_seconds=60)
+    # Buckets are per key
+    limiter.hit("other-client", limit=3, window_seconds=60)
+
+    # Once the window has slid past the earlier hits, calls are allowed again
+    now += 60
+    limiter.hit("client", limit=3, window_seconds=60)
@@ -1,46 +1,44 @@
 """Unit tests for StatsService aggregations."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 
-from app.models.models import Attempt, Item
+import pytest
+from sqlalchemy import func, select, text
 
+from app.models.models import Attempt
+from app.services.exceptions import ValidationError
+from tests._factories import make_item
 
-def _naive_utc_now() -> datetime:
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+# (days_ago, percentage, wer) for one attempt per day over the last five days
+DAILY_ATTEMPTS = tuple((i, 60 + i * 5, round(0.4 - i * 0.05, 2)) for i in range(5))
 
 
-def _create_item(db_manager, *, locale="en-US", text="hello", tags=None) -> Item:
-    with db_manager.get_session() as session:
-        item = Item(locale=locale, text=text, difficulty=1)
-        if tags is not None:
-            item.tags = tags
-        session.add(item)
-        session.commit()
-        session.refresh(item)
-        return item
+def _naive_utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-def _create_attempt(
-    db_manager,
+def _attempt_row(
     *,
     item_id: int,
     percentage: int,
     wer: float,
-    created_at: datetime | None = None,
+    created_at: datetime,
     text: str = "attempt",
-):
-    with db_manager.get_session() as session:
-        attempt = Attempt(
-            item_id=item_id,
-            text=text,
-            percentage=percentage,
-            wer=wer,
-            words_ref=4,
-            words_correct=max(0, min(4, round(percentage / 25))),
-            created_at=created_at or _naive_utc_now(),
-        )
-        session.add(attempt)
-        session.commit()
+) -> dict:
+    return {
+        "item_id": item_id,
+        "text": text,
+        "percentage": percentage,
+        "wer": wer,
+        "words_ref": 4,
+        "words_correct": max(0, min(4, round(percentage / 25))),
+        "created_at": created_at,
+    }
+
+
+def _insert_attempts(session, rows: list[dict]) -> None:
+    session.execute(Attempt.__table__.insert(), rows)
+    session.commit()
 
 
 def test_get_summary_stats_returns_zero_when_no_attempts(stats_service):
@@ -56,10 +54,16 @@ def test_get_summary_stats_returns_zero_when_no_attempts(stats_service):
     }
 
 
-def test_get_summary_stats_calculates_values(stats_service, db_manager):
-    item = _create_item(db_manager, text="Alpha")
-    _create_attempt(db_manager, item_id=item.id, percentage=80, wer=0.1)
-    _create_attempt(db_manager, item_id=item.id, percentage=60, wer=0.4)
+def test_get_summary_stats_calculates_values(stats_service, session):
+    now = _naive_utc_now()
+    item_id = make_item(session, text="Alpha").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(item_id=item_id, percentage=80, wer=0.1, created_at=now),
+            _attempt_row(item_id=item_id, percentage=60, wer=0.4, created_at=now),
+        ],
+    )
 
     summary = stats_service.get_summary_stats()
 
@@ -71,23 +75,44 @@ def test_get_summary_stats_calculates_values(stats_service, db_manager):
     assert summary["total_practice_time_minutes"] == 1.0
 
 
-def test_get_practice_log_returns_paginated_entries(stats_service, db_manager):
-    now = _naive_utc_now()
-    newer_item = _create_item(db_manager, text="New", tags=["focus"])
-    older_item = _create_item(db_manager, text="Old", tags=["review"])
-    _create_attempt(
-        db_manager,
-        item_id=older_item.id,
-        percentage=55,
-        wer=0.45,
-        created_at=now - timedelta(days=2),
+def test_get_summary_stats_window_is_half_open(stats_service, session):
+    since = datetime(2025, 1, 1)
+    until = since + timedelta(days=1)
+    item_id = make_item(session, text="Window").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(item_id=item_id, percentage=p, wer=0.5, created_at=at)
+            for p, at in ((40, since), (60, until - timedelta(seconds=1)), (99, until))
+        ],
     )
-    _create_attempt(
-        db_manager,
-        item_id=newer_item.id,
-        percentage=92,
-        wer=0.08,
-        created_at=now - timedelta(minutes=5),
+
+    summary = stats_service.get_summary_stats(since=since, until=until)
+
+    assert summary["total_attempts"] == 2
+    assert (summary["best_score"], summary["worst_score"]) == (60, 40)
+
+
+def test_get_practice_log_returns_paginated_entries(stats_service, session):
+    now = _naive_utc_now()
+    newer_item_id = make_item(session, text="New", tags=["focus"]).id
+    older_item_id = make_item(session, text="Old", tags=["review"]).id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=older_item_id,
+                percentage=55,
+                wer=0.45,
+                created_at=now - timedelta(days=2),
+            ),
+            _attempt_row(
+                item_id=newer_item_id,
+                percentage=92,
+                wer=0.08,
+                created_at=now - timedelta(minutes=5),
+            ),
+        ],
     )
 
     result = stats_service.get_practice_log(page=1, per_page=1)
@@ -96,11 +121,256 @@ def test_get_practice_log_returns_paginated_entries(stats_service, db_manager):
     assert result["total_pages"] == 2
     assert len(result["practice_log"]) == 1
     entry = result["practice_log"][0]
-    assert entry["item_id"] == newer_item.id
+    assert entry["item_id"] == newer_item_id
     assert entry["attempt_count"] == 1
     assert entry["tags"] == ["focus"]
     assert entry["best_score"] == 92
 
 
+def test_get_practice_log_aggregates_attempts_per_item(stats_service, session):
+    now = _naive_utc_now()
+    item1_id = make_item(session, text="First").id
+    item2_id = make_item(session, text="Second").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(item_id=item1_id, percentage=80, wer=0.2, created_at=now),
+            _attempt_row(item_id=item1_id, percentage=40, wer=0.6, created_at=now),
+            _attempt_row(item_id=item2_id, percentage=100, wer=0.0, created_at=now),
+        ],
+    )
+
+    result = stats_service.get_practice_log(page=1, per_page=10)
+
+    by_id = {log["item_id"]: log for log in result["practice_log"]}
+    assert by_id.keys() == {item1_id, item2_id}
+    item1_log = by_id[item1_id]
+    assert item1_log["attempt_count"] == 2
+    assert item1_log["average_score"] == 60.0
+    assert item1_log["best_score"] == 80
+    assert by_id[item2_id]["attempt_count"] == 1
+
+
+def test_get_practice_log_window_applies_before_aggregating(stats_service, session):
+    now = _naive_utc_now()
+    item_id = make_item(session, text="Windowed").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id,
+                percentage=10,
+                wer=0.9,
+                created_at=now - timedelta(days=3),
+            ),
+            _attempt_row(item_id=item_id, percentage=90, wer=0.1, created_at=now),
+        ],
+    )
+
+    result = stats_service.get_practice_log(since=now - timedelta(days=1))
+
+    assert result["total"] == 1
+    (entry,) = result["practice_log"]
+    assert (entry["attempt_count"], entry["worst_score"]) == (1, 90)
+    assert entry["text"] == "Windowed"
+
+
+def test_get_practice_log_cursor_walks_every_entry_once(stats_service, session):
+    now = _naive_utc_now()
+    item_ids = [make_item(session, text=f"Item {i}").id for i in range(5)]
+    # Two items share a timestamp so the item-id tiebreak is exercised
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id,
+                percentage=50,
+                wer=0.5,
+                created_at=now - timedelta(minutes=min(i, 3)),
+            )
+            for i, item_id in enumerate(item_ids)
+        ],
+    )
+
+    first = stats_service.get_practice_log(page=1, per_page=2)
+    seen = [entry["item_id"] for entry in first["practice_log"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        result = stats_service.get_practice_log(per_page=2, cursor=cursor)
+        assert result["total"] is None
+        seen.extend(entry["item_id"] for entry in result["practice_log"])
+        cursor = result["next_cursor"]
+
+    assert first["total"] == 5
+    assert seen == [item_ids[i] for i in (0, 1, 2, 4, 3)]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30=", "bnVsbA=="])
+def test_get_practice_log_rejects_malformed_cursor(stats_service, cursor):
+    with pytest.raises(ValidationError) as excinfo:
+        stats_service.get_practice_log(cursor=cursor)
+
+    assert excinfo.value.status_code == 400
+
+
 def test_get_item_stats_returns_none_when_item_missing(stats_service):
     assert stats_service.get_item_stats(item_id=123456) is None
+
+
+def test_get_item_stats_aggregates_attempts(stats_service, session):
+    now = _naive_utc_now()
+    item_id = make_item(session, text="Stats").id
+    idle_item_id = make_item(session, text="Idle").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id,
+                percentage=50,
+                wer=0.5,
+                created_at=now - timedelta(hours=1),
+            ),
+            _attempt_row(item_id=item_id, percentage=100, wer=0.0, created_at=now),
+        ],
+    )
+
+    stats = stats_service.get_item_stats(item_id)
+
+    assert stats["text"] == "Stats"
+    assert stats["attempts_count"] == 2
+    assert stats["avg_percentage"] == 75.0
+    assert (stats["best_percentage"], stats["worst_percentage"]) == (100, 50)
+    assert (stats["best_wer"], stats["worst_wer"]) == (0.0, 0.5)
+    assert stats["last_attempt_at"] == now.isoformat()
+    idle = stats_service.get_item_stats(idle_item_id)
+    assert (idle["text"], idle["attempts_count"]) == ("Idle", 0)
+
+
+def test_get_progress_over_time_groups_attempts_per_day(stats_service, session):
+    # Progress buckets use the server's local calendar day
+    now = datetime.now()
+    item_id = make_item(session, text="Daily").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id,
+                percentage=percentage,
+                wer=wer,
+                created_at=now - timedelta(days=days_ago),
+                text=f"Attempt {days_ago}",
+            )
+            for days_ago, percentage, wer in DAILY_ATTEMPTS
+        ],
+    )
+
+    progress = stats_service.get_progress_over_time(item_id=item_id, days=30)
+
+    assert [entry["attempts"] for entry in progress] == [1] * len(DAILY_ATTEMPTS)
+    assert [entry["avg_percentage"] for entry in progress] == [
+        percentage for _, percentage, _ in reversed(DAILY_ATTEMPTS)
+    ]
+    assert progress[-1]["date"] == now.date().isoformat()
+
+
+def test_get_progress_over_time_window_starts_at_midnight(stats_service, session):
+    window_start = datetime.combine(datetime.now().date() - timedelta(days=1), time.min)
+    item_id = make_item(session, text="Boundary").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id,
+                percentage=percentage,
+                wer=0.5,
+                created_at=window_start + offset,
+            )
+            for percentage, offset in ((10, -timedelta(seconds=1)), (70, timedelta()))
+        ],
+    )
+
+    progress = stats_service.get_progress_over_time(item_id=item_id, days=2)
+
+    assert progress == [
+        {
+            "date": window_start.date().isoformat(),
+            "attempts": 1,
+            "avg_percentage": 70.0,
+            "avg_wer": 0.5,
+        }
+    ]
+
+
+def test_item_stats_query_searches_attempts_by_item(db_manager):
+    stmt = select(
+        func.min(Attempt.created_at),
+        func.max(Attempt.created_at),
+        func.avg(Attempt.percentage),
+    ).where(Attempt.item_id == 1)
+    sql = stmt.compile(db_manager.engine, compile_kwargs={"literal_binds": True})
+
+    with db_manager.get_session() as session:
+        plan = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+    details = [row[-1] for row in plan]
+    assert any("idx_attempts_item_created (item_id=?)" in d for d in details), details
+    assert not any(d.startswith("SCAN attempts") for d in details), details
+
+
+def test_get_summary_stats_is_cached_until_attempts_change(
+    stats_service, attempts_service, session
+):
+    item_id = make_item(session, text="Cached").id
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id, percentage=50, wer=0.5, created_at=_naive_utc_now()
+            )
+        ],
+    )
+    assert stats_service.get_summary_stats()["total_attempts"] == 1
+
+    # Rows written behind the service's back stay hidden until the TTL lapses
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id, percentage=70, wer=0.3, created_at=_naive_utc_now()
+            )
+        ],
+    )
+    assert stats_service.get_summary_stats()["total_attempts"] == 1
+
+    attempts_service.create_attempt(item_id, "Cached")
+    assert stats_service.get_summary_stats()["total_attempts"] == 3
+
+
+def test_get_summary_stats_drops_cache_when_item_deleted(
+    stats_service, attempts_service, items_service, session
+):
+    item_id = make_item(session, text="Doomed").id
+    attempts_service.create_attempt(item_id, "Doomed")
+    assert stats_service.get_summary_stats()["total_attempts"] == 1
+
+    # The delete cascades to the item's attempts
+    items_service.delete_item(item_id)
+
+    assert stats_service.get_summary_stats()["total_attempts"] == 0
+
+
+def test_get_summary_stats_cache_can_be_disabled(stats_service, session):
+    item_id = make_item(session, text="Uncached").id
+    stats_service.set_cache_enabled(False)
+    assert stats_service.get_summary_stats()["total_attempts"] == 0
+
+    _insert_attempts(
+        session,
+        [
+            _attempt_row(
+                item_id=item_id, percentage=50, wer=0.5, created_at=_naive_utc_now()
+            )
+        ],
+    )
+
+    assert stats_service.get_summary_stats()["total_attempts"] == 1
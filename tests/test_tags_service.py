@@ -1,6 +1,7 @@
 """Unit tests for TagsService."""
 
 import pytest
+from sqlalchemy import event
 
 from app.core.exceptions import ValidationException
 from app.models.schemas import TagCreateRequest
@@ -29,3 +30,23 @@ def test_duplicate_tag_creation_raises(tags_service):
 
     with pytest.raises(ValidationException):
         tags_service.create_tag(TagCreateRequest(name="repeat"))
+
+
+def test_create_tag_reads_server_defaults_without_refresh(tags_service, db_manager):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        verb = statement.split()[0]
+        if verb in {"INSERT", "SELECT", "UPDATE", "DELETE"}:
+            statements.append(verb)
+
+    event.listen(db_manager.engine, "before_cursor_execute", _record)
+    try:
+        tag = tags_service.create_tag(TagCreateRequest(name="fresh"))
+    finally:
+        event.remove(db_manager.engine, "before_cursor_execute", _record)
+
+    assert tag.id is not None
+    assert tag.created_at is not None
+    # Duplicate-name probe, then the INSERT; no SELECT to reload the row
+    assert statements == ["SELECT", "INSERT"]
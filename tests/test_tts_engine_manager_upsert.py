@@ -1,34 +1,55 @@
-"""Tests for task-message upsert logic in TTSEngineManager._update_task_from_message."""
+"""Tests for TTSEngineManager task upserts and item-to-task linking."""
 
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import Iterable
 
-from app.models.database_manager import Base
-from app.models.enums import TaskStatus
-from app.models.models import Task
+import pytest
+
+from app.core.config import settings
+from app.models.enums import ItemTTSStatus, TaskKind, TaskStatus
+from app.models.models import Item, ItemTTS, Task
 from app.tts_engine.tts_engine_manager import TTSEngineManager
+from tests._factories import clear_tables, make_item, relax_sqlite_durability
+
+_METADATA_TEMPLATE = MappingProxyType({"text": "hello", "device": "test-device"})
 
 
-def _reset_schema(db_manager):
-    Base.metadata.drop_all(bind=db_manager.engine)
-    Base.metadata.create_all(bind=db_manager.engine)
+def _message(request_id, status, output_file_path=None, **metadata):
+    return {
+        "request_id": request_id,
+        "status": status,
+        "output_file_path": output_file_path,
+        "metadata": {**_METADATA_TEMPLATE, **metadata},
+    }
 
 
-def test_inserts_missing_task_from_message(test_db_url):
+@pytest.fixture(scope="module")
+def module_manager(test_db_url) -> Iterable[TTSEngineManager]:
     manager = TTSEngineManager(test_db_url, tts_service=None)
-    _reset_schema(manager.db_manager)
-
-    message = {
-        "request_id": "task-123",
-        "status": TaskStatus.COMPLETED,
-        "output_file_path": "/tmp/audio.wav",
-        "metadata": {
-            "text": "hello world",
-            "completed_at": datetime.now().isoformat(),
-            "file_size": 321,
-            "sampling_rate": 24000,
-            "device": "test-device",
-        },
-    }
+    relax_sqlite_durability(manager.db_manager.engine)
+    try:
+        yield manager
+    finally:
+        manager.db_manager.close()
+
+
+@pytest.fixture()
+def manager(module_manager) -> TTSEngineManager:
+    clear_tables(module_manager.db_manager.engine)
+    return module_manager
+
+
+def test_inserts_missing_task_from_message(manager):
+    message = _message(
+        "task-123",
+        TaskStatus.COMPLETED,
+        "/tmp/audio.wav",
+        text="hello world",
+        completed_at=datetime.now().isoformat(),
+        file_size=321,
+        sampling_rate=24000,
+    )
 
     manager._update_task_from_message(message)
 
@@ -43,9 +64,8 @@ def test_inserts_missing_task_from_message(test_db_url):
         assert task.device == "test-device"
 
 
-def test_updates_existing_task_from_message(test_db_url):
-    manager = TTSEngineManager(test_db_url, tts_service=None)
-    _reset_schema(manager.db_manager)
+def test_updates_existing_task_from_message(manager):
+    now = datetime.now()
 
     # Seed a queued task
     with manager.db_manager.get_session() as session:
@@ -54,23 +74,18 @@ def test_updates_existing_task_from_message(test_db_url):
             original_text="hello",
             text_hash="hash",
             status=TaskStatus.QUEUED,
-            created_at=datetime.now(),
-            submitted_at=datetime.now(),
+            created_at=now,
+            submitted_at=now,
         )
         session.add(seeded)
         session.commit()
 
-    message = {
-        "request_id": "task-queued",
-        "status": TaskStatus.FAILED,
-        "output_file_path": None,
-        "metadata": {
-            "text": "hello",
-            "failed_at": datetime.now().isoformat(),
-            "error": "boom",
-            "device": "test-device",
-        },
-    }
+    message = _message(
+        "task-queued",
+        TaskStatus.FAILED,
+        failed_at=now.isoformat(),
+        error="boom",
+    )
 
     manager._update_task_from_message(message)
 
@@ -81,3 +96,70 @@ def test_updates_existing_task_from_message(test_db_url):
         assert task.status == TaskStatus.FAILED
         assert task.error_message == "boom"
         assert task.device == "test-device"
+
+
+@pytest.mark.parametrize(
+    "raw_kind,expected",
+    [
+        (None, TaskKind.GENERATE),
+        ("regenerate", TaskKind.REGENERATE),
+        ("bogus", TaskKind.GENERATE),
+    ],
+    ids=["default", "regenerate", "unknown-falls-back"],
+)
+def test_inserted_task_resolves_task_kind(manager, raw_kind, expected):
+    metadata = {"task_kind": raw_kind} if raw_kind else {}
+
+    manager._update_task_from_message(
+        _message("task-kind", TaskStatus.QUEUED, **metadata)
+    )
+
+    with manager.db_manager.get_session() as session:
+        task = session.query(Task).filter(Task.task_id == "task-kind").one()
+
+        assert task.task_kind == expected
+
+
+def test_message_timestamps_accept_z_suffix(manager):
+    # Python 3.11's fromisoformat parses "Z" directly; no string munging needed
+    manager._update_task_from_message(
+        _message(
+            "task-utc",
+            TaskStatus.COMPLETED,
+            submitted_at="2025-01-01T11:59:00Z",
+            completed_at="2025-01-01T12:00:00Z",
+        )
+    )
+
+    with manager.db_manager.get_session() as session:
+        task = session.query(Task).filter(Task.task_id == "task-utc").one()
+
+        assert task.submitted_at == datetime(2025, 1, 1, 11, 59)
+        assert task.completed_at == datetime(2025, 1, 1, 12, 0)
+
+
+def test_submit_task_for_item_links_item_to_completed_task(manager, monkeypatch):
+    # The service is never reached: the completed task dedupes the submission
+    monkeypatch.setattr(manager, "tts_service", SimpleNamespace())
+    with manager.db_manager.get_session() as session:
+        session.add(
+            Task(
+                task_id="task-done",
+                original_text="hello",
+                text_hash=manager._calculate_text_hash("hello"),
+                status=TaskStatus.COMPLETED,
+            )
+        )
+        item_id = make_item(session, text="hello").id
+        session.commit()
+
+    task_id = manager.submit_task_for_item(
+        item_id, "hello", language=settings.tts_supported_languages[0]
+    )
+
+    assert task_id == "task-done"
+    with manager.db_manager.get_session() as session:
+        assert session.get(Item, item_id).task_id == "task-done"
+        tts = session.query(ItemTTS).filter(ItemTTS.item_id == item_id).one()
+        assert tts.status == ItemTTSStatus.READY
+